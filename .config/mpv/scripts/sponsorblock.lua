@@ -72,6 +72,18 @@ local options = {
 	-- Length of the sha256 prefix (3-32) when querying server, 0 to disable
 	sha256_length = 4,
 
+	-- How long to reuse segments fetched from the server, including videos without any
+	-- Format: "X[d,h,m]", leave blank to always query the server
+	cache_ttl = "1h",
+
+	-- Fetch segments for the rest of the playlist ahead of time, needs cache_ttl
+	prefetch_playlist = true,
+
+	-- Keep one Python helper running for the whole mpv session instead of starting one per request
+	-- It talks to mpv over input-ipc-server. If mpv has none, this sets input-ipc-server to a private
+	-- socket for the session, visible to other scripts and IPC clients, and clears it again on shutdown
+	persistent_helper = true,
+
 	-- Pattern for video id in local files, ignored if blank
 	-- Recommended value for base youtube-dl is "-([%w-_]+)%.[mw][kpe][v4b]m?$"
 	local_pattern = "",
@@ -98,8 +110,11 @@ local sponsorblock = utils.join_path(scripts_dir, "sponsorblock_shared/sponsorbl
 local uid_path = utils.join_path(scripts_dir, "sponsorblock_shared/sponsorblock.txt")
 local database_file = options.local_database and utils.join_path(scripts_dir, "sponsorblock_shared/sponsorblock.db")
 	or ""
+local cache_file = utils.join_path(scripts_dir, "sponsorblock_shared/cache.db")
 local youtube_id = nil
 local ranges = {}
+-- Bumped on every file load so helper replies for an earlier file are dropped
+local ranges_request = 0
 local init = false
 local segment = { a = 0, b = 0, progress = 0, first = true }
 local retrying = false
@@ -112,6 +127,11 @@ local categories = {}
 local all_categories =
 	{ "sponsor", "intro", "outro", "interaction", "selfpromo", "preview", "music_offtopic", "filler" }
 local chapter_cache = {}
+local helper_client = nil
+local helper_requests = {}
+local helper_next = 0
+local prefetched = {}
+local prefetch_timer = nil
 
 for category in string.gmatch(options.skip_categories, "([^,]+)") do
 	categories[category] = true
@@ -127,14 +147,6 @@ function file_exists(name)
 	end
 end
 
-function t_count(t)
-	local count = 0
-	for _ in pairs(t) do
-		count = count + 1
-	end
-	return count
-end
-
 function time_sort(a, b)
 	if a.time == b.time then
 		return string.match(a.title, "segment end")
@@ -142,8 +154,8 @@ function time_sort(a, b)
 	return a.time < b.time
 end
 
-function parse_update_interval()
-	local s = options.auto_update_interval
+function parse_interval(name)
+	local s = options[name]
 	if s == "" then
 		return 0
 	end -- Interval Disabled
@@ -151,7 +163,7 @@ function parse_update_interval()
 	local num, mod = s:match("^(%d+)([hdm])$")
 
 	if num == nil or mod == nil then
-		mp.osd_message("[sponsorblock] auto_update_interval " .. s .. " is invalid", 5)
+		mp.osd_message("[sponsorblock] " .. name .. " " .. s .. " is invalid", 5)
 		return nil
 	end
 
@@ -216,7 +228,7 @@ function process(uuid, t, new_ranges)
 	end
 end
 
-function getranges(_, exists, db, more)
+function getranges(_, exists, db)
 	if type(exists) == "table" and exists["status"] == "1" then
 		if options.server_fallback then
 			mp.add_timeout(0, function()
@@ -240,7 +252,6 @@ function getranges(_, exists, db, more)
 		mp.osd_message("[sponsorblock] database update succeeded")
 		retrying = false
 	end
-	local sponsors
 	local args = {
 		options.python_path,
 		sponsorblock,
@@ -250,37 +261,46 @@ function getranges(_, exists, db, more)
 		youtube_id,
 		options.categories,
 		tostring(options.sha256_length),
+		cache_file,
+		tostring(parse_interval("cache_ttl") or 0),
 	}
+	if helper_client then
+		local id, request = youtube_id, ranges_request
+		return helper_request(args, function(stdout)
+			if id == youtube_id and request == ranges_request then
+				apply_ranges(stdout)
+			end
+		end)
+	end
+	local sponsors
 	if not legacy then
 		sponsors = mp.command_native({ name = "subprocess", capture_stdout = true, playback_only = false, args = args })
 	else
 		sponsors = utils.subprocess({ args = args })
 	end
-	mp.msg.debug("Got: " .. string.gsub(sponsors.stdout, "[\n\r]", ""))
-	if not string.match(sponsors.stdout, "^%s*(.*%S)") then
+	apply_ranges(sponsors.stdout)
+end
+
+function apply_ranges(stdout)
+	mp.msg.debug("Got: " .. string.gsub(stdout, "[\n\r]", ""))
+	if not string.match(stdout, "^%s*(.*%S)") then
 		return
 	end
-	if string.match(sponsors.stdout, "error") then
+	if string.match(stdout, "error") then
 		return getranges(true, true)
 	end
+	-- Local and online replies can land in either order, so merge them
 	local new_ranges = {}
-	local r_count = 0
-	if more then
-		r_count = -1
+	for uuid, t in pairs(ranges) do
+		new_ranges[uuid] = t
 	end
-	for t in string.gmatch(sponsors.stdout, "[^:%s]+") do
+	for t in string.gmatch(stdout, "[^:%s]+") do
 		uuid = string.match(t, "([^,]+),[^,]+$")
-		if ranges[uuid] then
-			new_ranges[uuid] = ranges[uuid]
-		else
+		if not ranges[uuid] then
 			process(uuid, t, new_ranges)
 		end
-		r_count = r_count + 1
-	end
-	local c_count = t_count(ranges)
-	if c_count == 0 or r_count >= c_count then
-		ranges = new_ranges
 	end
+	ranges = new_ranges
 end
 
 function fast_forward()
@@ -348,7 +368,9 @@ function skip_ads(name, pos)
 					options.user_id,
 					options.auto_upvote and "1" or "",
 				}
-				if not legacy then
+				if helper_client then
+					helper_request(args, function() end)
+				elseif not legacy then
 					mp.command_native_async({ name = "subprocess", playback_only = false, args = args }, function() end)
 				else
 					utils.subprocess_detached({ args = args })
@@ -420,7 +442,9 @@ function vote(dir)
 		options.user_id,
 		dir,
 	}
-	if not legacy then
+	if helper_client then
+		helper_request(args, function() end)
+	elseif not legacy then
 		mp.command_native_async({ name = "subprocess", playback_only = false, args = args }, function() end)
 	else
 		utils.subprocess({ args = args })
@@ -445,36 +469,89 @@ function update()
 	)
 end
 
-function file_loaded()
-	local initialized = init
-	ranges = {}
-	segment = { a = 0, b = 0, progress = 0, first = true }
-	last_skip = { uuid = "", dir = nil }
-	chapter_cache = {}
-	local video_path = mp.get_property("path", "")
-	mp.msg.debug("Path: " .. video_path)
-	local video_referer = string.match(mp.get_property("http-header-fields", ""), "Referer:([^,]+)") or ""
-	mp.msg.debug("Referer: " .. video_referer)
-
+function find_youtube_id(video_path, video_referer)
 	local urls = {
 		"https?://youtu%.be/([%w-_]+).*",
 		"https?://w?w?w?%.?youtube%.com/v/([%w-_]+).*",
 		"/watch.*[?&]v=([%w-_]+).*",
 		"/embed/([%w-_]+).*",
 	}
-	youtube_id = nil
+	local id = nil
 	for i, url in ipairs(urls) do
-		youtube_id = youtube_id or string.match(video_path, url) or string.match(video_referer, url)
-		if youtube_id then
+		id = id or string.match(video_path, url) or string.match(video_referer, url)
+		if id then
 			break
 		end
 	end
-	youtube_id = youtube_id or string.match(video_path, options.local_pattern)
+	id = id or string.match(video_path, options.local_pattern)
+
+	if not id or string.len(id) < 11 or (local_pattern and string.len(id) ~= 11) then
+		return nil
+	end
+	return string.sub(id, 1, 11)
+end
+
+function schedule_prefetch()
+	if prefetch_timer ~= nil then
+		prefetch_timer:kill()
+	end
+	prefetch_timer = mp.add_timeout(1, prefetch)
+end
 
-	if not youtube_id or string.len(youtube_id) < 11 or (local_pattern and string.len(youtube_id) ~= 11) then
+function prefetch()
+	prefetch_timer = nil
+	local ttl = parse_interval("cache_ttl") or 0
+	if options.local_database or ttl == 0 then
+		return
+	end
+	local ids = {}
+	local now = mp.get_time()
+	for _, entry in ipairs(mp.get_property_native("playlist", {})) do
+		local id = find_youtube_id(entry.filename, "")
+		-- Entries are fetched again once their cached segments have expired
+		if id and (prefetched[id] == nil or now - prefetched[id] >= ttl) then
+			prefetched[id] = now
+			table.insert(ids, id)
+		end
+	end
+	if #ids == 0 then
+		return
+	end
+	local args = {
+		options.python_path,
+		sponsorblock,
+		"prefetch",
+		database_file,
+		options.server_address,
+		table.concat(ids, ","),
+		options.categories,
+		tostring(options.sha256_length),
+		cache_file,
+		tostring(ttl),
+	}
+	if helper_client then
+		helper_request(args, function() end)
+	elseif not legacy then
+		mp.command_native_async({ name = "subprocess", playback_only = false, args = args }, function() end)
+	end
+end
+
+function file_loaded()
+	local initialized = init
+	ranges = {}
+	ranges_request = ranges_request + 1
+	segment = { a = 0, b = 0, progress = 0, first = true }
+	last_skip = { uuid = "", dir = nil }
+	chapter_cache = {}
+	local video_path = mp.get_property("path", "")
+	mp.msg.debug("Path: " .. video_path)
+	local video_referer = string.match(mp.get_property("http-header-fields", ""), "Referer:([^,]+)") or ""
+	mp.msg.debug("Referer: " .. video_referer)
+
+	youtube_id = find_youtube_id(video_path, video_referer)
+	if not youtube_id then
 		return
 	end
-	youtube_id = string.sub(youtube_id, 1, 11)
 	mp.msg.debug("Found YouTube ID: " .. youtube_id)
 	init = true
 	if not options.local_database then
@@ -484,7 +561,7 @@ function file_loaded()
 		if exists and options.server_fallback then
 			getranges(true, true)
 			mp.add_timeout(0, function()
-				getranges(true, true, "", true)
+				getranges(true, true, "")
 			end)
 		elseif exists then
 			getranges(true, true)
@@ -514,7 +591,9 @@ function file_loaded()
 			options.user_id,
 			options.display_name,
 		}
-		if not legacy then
+		if helper_client then
+			helper_request(args, function() end)
+		elseif not legacy then
 			mp.command_native_async({ name = "subprocess", playback_only = false, args = args }, function() end)
 		else
 			utils.subprocess_detached({ args = args })
@@ -527,7 +606,7 @@ function file_loaded()
 	if file_exists(database_file) then
 		local db_info = utils.file_info(database_file)
 		local cur_time = os.time(os.date("*t"))
-		local upd_interval = parse_update_interval()
+		local upd_interval = parse_interval("auto_update_interval")
 		if upd_interval == nil or os.difftime(cur_time, db_info.mtime) < upd_interval then
 			return
 		end
@@ -613,7 +692,6 @@ function submit_segment(category)
 		)
 	else
 		mp.osd_message("[sponsorblock] submitting segment...", 30)
-		local submit
 		local args = {
 			options.python_path,
 			sponsorblock,
@@ -627,36 +705,101 @@ function submit_segment(category)
 			options.user_id,
 			category or "sponsor",
 		}
+		if helper_client then
+			return helper_request(args, function(stdout)
+				submitted(stdout, start_time, end_time)
+			end)
+		end
+		local submit
 		if not legacy then
 			submit =
 				mp.command_native({ name = "subprocess", capture_stdout = true, playback_only = false, args = args })
 		else
 			submit = utils.subprocess({ args = args })
 		end
-		if string.match(submit.stdout, "success") then
-			segment = { a = 0, b = 0, progress = 0, first = true }
-			mp.osd_message("[sponsorblock] segment submitted")
-			if options.make_chapters then
-				clean_chapters()
-				create_chapter("Submitted segment start", start_time)
-				create_chapter("Submitted segment end", end_time)
-			end
-		elseif string.match(submit.stdout, "error") then
-			mp.osd_message("[sponsorblock] segment submission failed, server may be down. try again", 5)
-		elseif string.match(submit.stdout, "502") then
-			mp.osd_message("[sponsorblock] segment submission failed, server is down. try again", 5)
-		elseif string.match(submit.stdout, "400") then
-			mp.osd_message("[sponsorblock] segment submission failed, impossible inputs", 5)
-			segment = { a = 0, b = 0, progress = 0, first = true }
-		elseif string.match(submit.stdout, "429") then
-			mp.osd_message("[sponsorblock] segment submission failed, rate limited. try again", 5)
-		elseif string.match(submit.stdout, "409") then
-			mp.osd_message("[sponsorblock] segment already submitted", 3)
-			segment = { a = 0, b = 0, progress = 0, first = true }
-		else
-			mp.osd_message("[sponsorblock] segment submission failed", 5)
+		submitted(submit.stdout, start_time, end_time)
+	end
+end
+
+function submitted(stdout, start_time, end_time)
+	if string.match(stdout, "success") then
+		segment = { a = 0, b = 0, progress = 0, first = true }
+		mp.osd_message("[sponsorblock] segment submitted")
+		if options.make_chapters then
+			clean_chapters()
+			create_chapter("Submitted segment start", start_time)
+			create_chapter("Submitted segment end", end_time)
+		end
+	elseif string.match(stdout, "error") then
+		mp.osd_message("[sponsorblock] segment submission failed, server may be down. try again", 5)
+	elseif string.match(stdout, "502") then
+		mp.osd_message("[sponsorblock] segment submission failed, server is down. try again", 5)
+	elseif string.match(stdout, "400") then
+		mp.osd_message("[sponsorblock] segment submission failed, impossible inputs", 5)
+		segment = { a = 0, b = 0, progress = 0, first = true }
+	elseif string.match(stdout, "429") then
+		mp.osd_message("[sponsorblock] segment submission failed, rate limited. try again", 5)
+	elseif string.match(stdout, "409") then
+		mp.osd_message("[sponsorblock] segment already submitted", 3)
+		segment = { a = 0, b = 0, progress = 0, first = true }
+	else
+		mp.osd_message("[sponsorblock] segment submission failed", 5)
+	end
+end
+
+function helper_request(args, callback)
+	helper_next = helper_next + 1
+	helper_requests[tostring(helper_next)] = callback
+	mp.commandv(
+		"script-message-to",
+		helper_client,
+		"sponsorblock-request",
+		tostring(helper_next),
+		(table.unpack or unpack)(args, 3)
+	)
+end
+
+function start_helper()
+	local socket = mp.get_property("input-ipc-server", "")
+	if socket == "" then
+		socket = utils.join_path(os.getenv("XDG_RUNTIME_DIR") or "/tmp", "mpv-sponsorblock-" .. utils.getpid())
+		mp.set_property("input-ipc-server", socket)
+		mp.register_event("shutdown", function()
+			mp.set_property("input-ipc-server", "")
+		end)
+	end
+	mp.command_native_async({
+		name = "subprocess",
+		playback_only = false,
+		args = { options.python_path, sponsorblock, "helper", socket, mp.get_script_name() },
+	}, function()
+		-- Requests still in flight are answered like a failed call so callers fall back
+		helper_client = nil
+		local pending = helper_requests
+		helper_requests = {}
+		for _, callback in pairs(pending) do
+			callback("error")
 		end
+	end)
+end
+
+mp.register_script_message("sponsorblock-helper", function(client)
+	helper_client = client
+end)
+mp.register_script_message("sponsorblock-reply", function(id, output)
+	local callback = helper_requests[id]
+	helper_requests[id] = nil
+	if callback then
+		callback(output)
 	end
+end)
+if options.persistent_helper and not legacy and not ON_WINDOWS then
+	start_helper()
+end
+if options.prefetch_playlist then
+	-- Queues grow one entry at a time, wait for them to settle before fetching
+	mp.observe_property("playlist-count", "number", schedule_prefetch)
+	mp.register_event("file-loaded", schedule_prefetch)
 end
 
 mp.register_event("file-loaded", file_loaded)
@@ -1,89 +1,237 @@
+import concurrent.futures
 import urllib.request
 import urllib.parse
+import http.client
+import threading
 import hashlib
 import sqlite3
+import socket
 import random
 import string
 import json
+import time
 import sys
+import io
 import os
 
-if sys.argv[1] in ["submit", "stats", "username"]:
-    if not sys.argv[8]:
-        if os.path.isfile(sys.argv[7]):
-            with open(sys.argv[7]) as f:  
+USER_AGENT = "mpv_sponsorblock/1.0 (https://github.com/po5/mpv_sponsorblock)"
+# Server responses kept in the segment cache, each covers every video sharing a hash prefix
+CACHE_ENTRIES = 2000
+# Concurrent server requests while prefetching a playlist
+PREFETCH_WORKERS = 4
+# Seconds a server request may stall before it counts as failed
+TIMEOUT = 10
+
+opener = urllib.request.build_opener()
+opener.addheaders = [("User-Agent", USER_AGENT)]
+urllib.request.install_opener(opener)
+
+connections = {}
+connections_lock = threading.Lock()
+databases = threading.local()
+
+
+def userid(argv):
+    if not argv[8]:
+        if os.path.isfile(argv[7]):
+            with open(argv[7]) as f:
                 uid = f.read()
         else:
             uid = "".join(random.choices(string.ascii_letters + string.digits, k=36))
-            with open(sys.argv[7], "w") as f:
+            with open(argv[7], "w") as f:
                 f.write(uid)
     else:
-        uid = sys.argv[8]
+        uid = argv[8]
+    return uid
+
+
+def urlopen(url, data=None, headers=None):
+    """Like urllib.request.urlopen, but reuses kept-alive connections and buffers the body"""
+    parts = urllib.parse.urlsplit(url)
+    key = (parts.scheme, parts.netloc)
+    path = (parts.path or "/") + ("?" + parts.query if parts.query else "")
+    headers = dict(headers or {}, **{"User-Agent": USER_AGENT})
+    while True:
+        with connections_lock:
+            idle = connections.setdefault(key, [])
+            conn = idle.pop() if idle else None
+        reused = conn is not None
+        if conn is None:
+            conn = (http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection)(parts.netloc, timeout=TIMEOUT)
+        try:
+            conn.request("GET" if data is None else "POST", path, body=data, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+        except TimeoutError:
+            conn.close()
+            raise
+        except (http.client.HTTPException, OSError) as e:
+            conn.close()
+            # The server may have dropped an idle connection, retry those once
+            if reused and data is None:
+                continue
+            raise urllib.error.URLError(e)
+        if response.will_close:
+            conn.close()
+        else:
+            with connections_lock:
+                connections[key].append(conn)
+        if response.status >= 400:
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, io.BytesIO(body))
+        return io.BytesIO(body)
+
+
+def database(path):
+    """Per-thread connection to the local database, reopened once update replaced the file"""
+    inode = os.stat(path).st_ino
+    opened = getattr(databases, "opened", {})
+    databases.opened = opened
+    if path not in opened or opened[path][0] != inode:
+        if path in opened:
+            # Let go of the replaced file so its space is freed
+            opened[path][1].close()
+        conn = sqlite3.connect(path)
+        conn.row_factory = sqlite3.Row
+        opened[path] = (inode, conn)
+    return opened[path][1]
 
-opener = urllib.request.build_opener()
-opener.addheaders = [("User-Agent", "mpv_sponsorblock/1.0 (https://github.com/po5/mpv_sponsorblock)")]
-urllib.request.install_opener(opener)
 
-if sys.argv[1] == "ranges" and (not sys.argv[2] or not os.path.isfile(sys.argv[2])):
-    sha = None
-    if 3 <= int(sys.argv[6]) <= 32:
-        sha = hashlib.sha256(sys.argv[4].encode()).hexdigest()[:int(sys.argv[6])]
+def hash_prefix(video, length):
+    if 3 <= int(length) <= 32:
+        return hashlib.sha256(video.encode()).hexdigest()[:int(length)]
+    return None
+
+
+def segment_cache(path):
+    if not os.path.isfile(path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        sqlite3.connect(path).execute("PRAGMA journal_mode = WAL").connection.close()
+    conn = database(path)
+    conn.execute("CREATE TABLE IF NOT EXISTS segments (url TEXT PRIMARY KEY, fetched REAL NOT NULL, body TEXT) WITHOUT ROWID")
+    return conn
+
+
+def skip_segments(argv, sha):
+    """Server response for the video or its hash prefix, [] when it has none
+
+    With a cache path and TTL in argv[7] and argv[8] responses are reused while
+    fresh, 404s included, and the oldest ones are evicted past CACHE_ENTRIES.
+    """
+    url = argv[3] + "/api/skipSegments" + ("/" + sha + "?" if sha else "?videoID=" + argv[4] + "&") + urllib.parse.urlencode([("categories", json.dumps(sorted(argv[5].split(","))))])
+    cache = None
+    if len(argv) > 8 and argv[7] and float(argv[8] or 0) > 0:
+        cache = segment_cache(argv[7])
+        row = cache.execute("SELECT fetched, body FROM segments WHERE url = ?", (url,)).fetchone()
+        if row and time.time() - row["fetched"] < float(argv[8]):
+            return json.loads(row["body"]) if row["body"] is not None else []
+    try:
+        body = urlopen(url).read().decode()
+    except urllib.error.HTTPError as e:
+        if e.code != 404:
+            raise
+        body = None
+    if cache:
+        with cache:
+            cache.execute("INSERT OR REPLACE INTO segments VALUES (?, ?, ?)", (url, time.time(), body))
+            cache.execute("DELETE FROM segments WHERE url NOT IN (SELECT url FROM segments ORDER BY fetched DESC LIMIT ?)", (CACHE_ENTRIES,))
+    return json.loads(body) if body is not None else []
+
+
+def ranges(argv):
+    if not argv[2] or not os.path.isfile(argv[2]):
+        return online_ranges(argv)
+    return local_ranges(argv)
+
+
+def online_ranges(argv):
+    sha = hash_prefix(argv[4], argv[6])
     times = []
     try:
-        response = urllib.request.urlopen(sys.argv[3] + "/api/skipSegments" + ("/" + sha + "?" if sha else "?videoID=" + sys.argv[4] + "&") + urllib.parse.urlencode([("categories", json.dumps(sys.argv[5].split(",")))]))
-        segments = json.load(response)
+        segments = skip_segments(argv, sha)
         for segment in segments:
-            if sha and sys.argv[4] != segment["videoID"]:
+            if sha and argv[4] != segment["videoID"]:
                 continue
             if sha:
                 for s in segment["segments"]:
                     times.append(str(s["segment"][0]) + "," + str(s["segment"][1]) + "," + s["UUID"] + "," + s["category"])
             else:
                 times.append(str(segment["segment"][0]) + "," + str(segment["segment"][1]) + "," + segment["UUID"] + "," + segment["category"])
-        print(":".join(times))
-    except (TimeoutError, urllib.error.URLError) as e:
-        print("error")
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            print("")
-        else:
-            print("error")
-elif sys.argv[1] == "ranges":
-    conn = sqlite3.connect(sys.argv[2])
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
+        return ":".join(times)
+    except (TimeoutError, urllib.error.URLError):
+        return "error"
+
+
+def local_ranges(argv):
+    c = database(argv[2]).cursor()
     times = []
-    for category in sys.argv[5].split(","):
-        c.execute("SELECT startTime, endTime, votes, UUID, category FROM sponsorTimes WHERE videoID = ? AND shadowHidden = 0 AND votes > -1 AND category = ?", (sys.argv[4], category))
-        sponsors = c.fetchall()
-        best = list(sponsors)
-        dealtwith = []
-        similar = []
-        for sponsor_a in sponsors:
-            for sponsor_b in sponsors:
-                if sponsor_a is not sponsor_b and sponsor_a["startTime"] >= sponsor_b["startTime"] and sponsor_a["startTime"] <= sponsor_b["endTime"]:
-                    similar.append([sponsor_a, sponsor_b])
-                    if sponsor_a in best:
-                        best.remove(sponsor_a)
-                    if sponsor_b in best:
-                        best.remove(sponsor_b)
-        for sponsors_a in similar:
-            if sponsors_a in dealtwith:
-                continue
-            group = set(sponsors_a)
-            for sponsors_b in similar:
-                if sponsors_b[0] in group or sponsors_b[1] in group:
-                    group.add(sponsors_b[0])
-                    group.add(sponsors_b[1])
-                    dealtwith.append(sponsors_b)
-            best.append(max(group, key=lambda x:x["votes"]))
-        for time in best:
-            times.append(str(time["startTime"]) + "," + str(time["endTime"]) + "," + time["UUID"] + "," + time["category"])
-    print(":".join(times))
-elif sys.argv[1] == "update":
+    categories = argv[5].split(",")
+    query = "SELECT startTime, endTime, votes, UUID, category FROM sponsorTimes WHERE videoID = ? AND category IN (" + ",".join("?" * len(categories)) + ")"
+    # Databases fetched before the compact format still carry hidden rows
+    if c.execute("PRAGMA user_version").fetchone()[0] < 1:
+        query += " AND shadowHidden = 0 AND votes > -1"
+    rows = c.execute(query, [argv[4]] + categories).fetchall()
+    for category in categories:
+        # Overlapping submissions form one cluster, the most voted one wins
+        sponsors = sorted((row for row in rows if row["category"] == category), key=lambda x: x["startTime"])
+        best = []
+        end = None
+        for sponsor in sponsors:
+            if best and sponsor["startTime"] <= end:
+                end = max(end, sponsor["endTime"])
+                if sponsor["votes"] > best[-1]["votes"]:
+                    best[-1] = sponsor
+            else:
+                best.append(sponsor)
+                end = sponsor["endTime"]
+        for segment in best:
+            times.append(str(segment["startTime"]) + "," + str(segment["endTime"]) + "," + segment["UUID"] + "," + segment["category"])
+    return ":".join(times)
+
+
+def prefetch(argv):
+    """Warm the segment cache for the comma separated videoIDs in argv[4], one request per hash prefix"""
+    if (argv[2] and os.path.isfile(argv[2])) or len(argv) < 9 or not argv[7]:
+        return
+    lookups = {}
+    for video in filter(None, argv[4].split(",")):
+        sha = hash_prefix(video, argv[6])
+        lookups.setdefault(sha or video, (video, sha))
+
+    def fetch(video, sha):
+        try:
+            skip_segments(argv[:4] + [video] + argv[5:], sha)
+        except (TimeoutError, urllib.error.URLError):
+            pass
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=PREFETCH_WORKERS) as pool:
+        for video, sha in lookups.values():
+            pool.submit(fetch, video, sha)
+
+
+def update(argv):
+    conn = None
     try:
-        urllib.request.urlretrieve(sys.argv[3] + "/database.db", sys.argv[2] + ".tmp")
-        os.replace(sys.argv[2] + ".tmp", sys.argv[2])
+        urllib.request.urlretrieve(argv[3] + "/database.db", argv[2] + ".download")
+        # Keep only what ranges reads, keyed for its videoID/category lookup
+        if os.path.isfile(argv[2] + ".tmp"):
+            os.remove(argv[2] + ".tmp")
+        conn = sqlite3.connect(argv[2] + ".tmp")
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("ATTACH DATABASE ? AS download", (argv[2] + ".download",))
+        conn.execute("CREATE TABLE sponsorTimes (videoID TEXT NOT NULL, category TEXT NOT NULL, UUID TEXT NOT NULL, startTime REAL NOT NULL, endTime REAL NOT NULL, votes INTEGER NOT NULL, PRIMARY KEY (videoID, category, UUID)) WITHOUT ROWID")
+        conn.execute("INSERT OR IGNORE INTO sponsorTimes SELECT videoID, category, UUID, startTime, endTime, votes FROM download.sponsorTimes WHERE shadowHidden = 0 AND votes > -1 ORDER BY videoID, category, UUID")
+        conn.commit()
+        conn.execute("DETACH DATABASE download")
+        conn.execute("PRAGMA user_version = 1")
+        conn.execute("VACUUM")
+        conn.execute("ANALYZE")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.close()
+        os.replace(argv[2] + ".tmp", argv[2])
+    except sqlite3.DatabaseError:
+        print("database update failed, invalid database", file=sys.stderr)
+        sys.exit(1)
     except PermissionError:
         print("database update failed, file currently in use", file=sys.stderr)
         sys.exit(1)
@@ -96,27 +244,80 @@ elif sys.argv[1] == "update":
     except urllib.error.URLError:
         print("database update failed", file=sys.stderr)
         sys.exit(1)
-elif sys.argv[1] == "submit":
+    finally:
+        # The download is a full upstream dump, never leave it behind
+        if conn is not None:
+            conn.close()
+        for leftover in (argv[2] + ".download", argv[2] + ".tmp"):
+            if os.path.isfile(leftover):
+                os.remove(leftover)
+
+
+def submit(argv):
     try:
-        req = urllib.request.Request(sys.argv[3] + "/api/skipSegments", data=json.dumps({"videoID": sys.argv[4], "segments": [{"segment": [float(sys.argv[5]), float(sys.argv[6])], "category": sys.argv[9]}], "userID": uid}).encode(), headers={"Content-Type": "application/json"})
-        response = urllib.request.urlopen(req)
-        print("success")
+        urlopen(argv[3] + "/api/skipSegments", data=json.dumps({"videoID": argv[4], "segments": [{"segment": [float(argv[5]), float(argv[6])], "category": argv[9]}], "userID": userid(argv)}).encode(), headers={"Content-Type": "application/json"})
+        return "success"
     except urllib.error.HTTPError as e:
-        print(e.code)
-    except:
-        print("error")
-elif sys.argv[1] == "stats":
+        return str(e.code)
+    except Exception:
+        return "error"
+
+
+def stats(argv):
     try:
-        if sys.argv[6]:
-            urllib.request.urlopen(sys.argv[3] + "/api/viewedVideoSponsorTime?UUID=" + sys.argv[5])
-        if sys.argv[9]:
-            urllib.request.urlopen(sys.argv[3] + "/api/voteOnSponsorTime?UUID=" + sys.argv[5] + "&userID=" + uid + "&type=" + sys.argv[9])
-    except:
+        if argv[6]:
+            urlopen(argv[3] + "/api/viewedVideoSponsorTime?UUID=" + argv[5])
+        if argv[9]:
+            urlopen(argv[3] + "/api/voteOnSponsorTime?UUID=" + argv[5] + "&userID=" + userid(argv) + "&type=" + argv[9])
+    except Exception:
         pass
-elif sys.argv[1] == "username":
+
+
+def username(argv):
     try:
-        data = urllib.parse.urlencode({"userID": uid, "userName": sys.argv[9]}).encode()
-        req = urllib.request.Request(sys.argv[3] + "/api/setUsername", data=data)
-        urllib.request.urlopen(req)
-    except:
+        data = urllib.parse.urlencode({"userID": userid(argv), "userName": argv[9]}).encode()
+        urlopen(argv[3] + "/api/setUsername", data=data, headers={"Content-Type": "application/x-www-form-urlencoded"})
+    except Exception:
         pass
+
+
+def helper(argv):
+    """Serve requests from sponsorblock.lua over mpv's IPC socket until mpv exits
+
+    Requests arrive as script-message-to <client> sponsorblock-request <id> <args...>
+    with the same arguments as a command line call, the output is sent back with
+    script-message-to <script> sponsorblock-reply <id> <output>.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(argv[2])
+    send_lock = threading.Lock()
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+
+    def send(command, **fields):
+        with send_lock:
+            sock.sendall(json.dumps(dict(fields, command=command)).encode() + b"\n")
+
+    def reply(request_id, args):
+        try:
+            output = helper_commands[args[1]](args)
+        except Exception:
+            output = "error"
+        send(["script-message-to", argv[3], "sponsorblock-reply", request_id, output or ""])
+
+    send(["client_name"], request_id=1)
+    for line in sock.makefile("rb"):
+        message = json.loads(line)
+        if message.get("request_id") == 1 and "data" in message:
+            send(["script-message-to", argv[3], "sponsorblock-helper", message["data"]])
+        elif message.get("event") == "client-message" and message["args"][0] == "sponsorblock-request":
+            pool.submit(reply, message["args"][1], [argv[0]] + message["args"][2:])
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+helper_commands = {"ranges": ranges, "prefetch": prefetch, "submit": submit, "stats": stats, "username": username}
+commands = dict(helper_commands, update=update, helper=helper)
+
+if __name__ == "__main__":
+    output = commands[sys.argv[1]](sys.argv)
+    if output is not None:
+        print(output)
@@ -0,0 +1,153 @@
+import importlib.util
+import json
+import random
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+
+SCRIPT = Path(__file__).parents[1] / "sponsorblock.py"
+CORPUS = Path(__file__).with_name("overlap_corpus.json")
+
+
+def load_sponsorblock():
+    spec = importlib.util.spec_from_file_location("sponsorblock", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def legacy_ranges(path, video, categories):
+    """The pairwise grouping local ranges used before the sort-and-sweep, kept verbatim"""
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    c = conn.cursor()
+    uuids = []
+    for category in categories.split(","):
+        c.execute("SELECT startTime, endTime, votes, UUID, category FROM sponsorTimes WHERE videoID = ? AND shadowHidden = 0 AND votes > -1 AND category = ?", (video, category))
+        sponsors = c.fetchall()
+        best = list(sponsors)
+        dealtwith = []
+        similar = []
+        for sponsor_a in sponsors:
+            for sponsor_b in sponsors:
+                if sponsor_a is not sponsor_b and sponsor_a["startTime"] >= sponsor_b["startTime"] and sponsor_a["startTime"] <= sponsor_b["endTime"]:
+                    similar.append([sponsor_a, sponsor_b])
+                    if sponsor_a in best:
+                        best.remove(sponsor_a)
+                    if sponsor_b in best:
+                        best.remove(sponsor_b)
+        for sponsors_a in similar:
+            if sponsors_a in dealtwith:
+                continue
+            group = set(sponsors_a)
+            for sponsors_b in similar:
+                if sponsors_b[0] in group or sponsors_b[1] in group:
+                    group.add(sponsors_b[0])
+                    group.add(sponsors_b[1])
+                    dealtwith.append(sponsors_b)
+            best.append(max(group, key=lambda x: x["votes"]))
+        uuids += [segment["UUID"] for segment in best]
+    conn.close()
+    return uuids
+
+
+def write_upstream(path, rows):
+    """Database laid out like the upstream dump, rows are [videoID, start, end, votes, UUID, category, shadowHidden]"""
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE sponsorTimes (videoID TEXT, startTime REAL, endTime REAL, votes INTEGER, UUID TEXT, category TEXT, shadowHidden INTEGER)")
+    conn.executemany("INSERT INTO sponsorTimes VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+
+class OverlapCorpusTests(unittest.TestCase):
+    """Runs the old and new local ranges grouping side by side over overlap_corpus.json
+
+    The corpus is modelled on community submissions (near-duplicate reads, nested
+    and chained segments, hidden and downvoted rows, a popular video with dozens
+    of submissions) since the public database can't be fetched from the tests.
+    Cases with a "differs" entry are where the sweep intentionally returns
+    something else, "legacy" records what the old grouping returned for them.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sponsorblock = load_sponsorblock()
+        cls.corpus = json.loads(CORPUS.read_text())
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.upstream = str(Path(cls.tmp.name) / "database.db")
+        write_upstream(cls.upstream, [[case["video"]] + row for case in cls.corpus["cases"] for row in case["rows"]])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def ranges(self, path, case):
+        argv = ["sponsorblock.py", "ranges", path, "", case["video"], self.corpus["categories"], "0"]
+        output = self.sponsorblock.local_ranges(argv)
+        return [segment.split(",")[2] for segment in output.split(":") if segment]
+
+    def test_matches_legacy_grouping(self):
+        for case in self.corpus["cases"]:
+            if "differs" in case:
+                continue
+            with self.subTest(case=case["name"]):
+                legacy = legacy_ranges(self.upstream, case["video"], self.corpus["categories"])
+                self.assertCountEqual(self.ranges(self.upstream, case), legacy)
+                self.assertCountEqual(case["expected"], legacy)
+
+    def test_documented_differences(self):
+        for case in self.corpus["cases"]:
+            if "differs" not in case:
+                continue
+            with self.subTest(case=case["name"]):
+                self.assertEqual(self.ranges(self.upstream, case), case["expected"])
+                # Ties make the old result depend on set iteration order
+                if case["legacy"] is not None:
+                    self.assertCountEqual(legacy_ranges(self.upstream, case["video"], self.corpus["categories"]), case["legacy"])
+
+    def test_compact_database_gives_the_same_ranges(self):
+        compact = str(Path(self.tmp.name) / "sponsorblock.db")
+        self.sponsorblock.update(["sponsorblock.py", "update", compact, Path(self.tmp.name).as_uri()])
+        for case in self.corpus["cases"]:
+            with self.subTest(case=case["name"]):
+                self.assertEqual(self.ranges(compact, case), case["expected"])
+
+    def test_sweep_keeps_the_most_voted_row_of_each_overlap_component(self):
+        rnd = random.Random(0)
+        path = str(Path(self.tmp.name) / "random.db")
+        rows = []
+        for video in range(300):
+            count = rnd.randint(0, 30)
+            votes = rnd.sample(range(1000), count)
+            for i in range(count):
+                start = round(rnd.uniform(0, 600), 1)
+                rows.append(["random%05d" % video, start, start + round(rnd.uniform(1, 90), 1), votes[i], "%d-%d" % (video, i), "sponsor", 0])
+        write_upstream(path, rows)
+        for video in range(300):
+            segments = [row for row in rows if row[0] == "random%05d" % video]
+            parent = list(range(len(segments)))
+
+            def root(i):
+                while parent[i] != i:
+                    i = parent[i]
+                return i
+
+            for i, a in enumerate(segments):
+                for j, b in enumerate(segments):
+                    if i != j and b[1] <= a[1] <= b[2]:
+                        parent[root(i)] = root(j)
+            components = {}
+            for i, segment in enumerate(segments):
+                components.setdefault(root(i), []).append(segment)
+            expected = [max(component, key=lambda x: x[3])[4] for component in components.values()]
+            with self.subTest(video=video):
+                argv = ["sponsorblock.py", "ranges", path, "", "random%05d" % video, "sponsor", "0"]
+                output = self.sponsorblock.local_ranges(argv)
+                self.assertCountEqual([segment.split(",")[2] for segment in output.split(":") if segment], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
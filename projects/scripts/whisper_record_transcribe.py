@@ -3,20 +3,68 @@
 
 from __future__ import annotations
 
+import abc
 import argparse
+import atexit
+import contextlib
+import fcntl
+import functools
+import hashlib
+import importlib
+import importlib.util
+import io
+import json
 import os
+import re
+import resource
+import select
 import shutil
 import signal
+import socket
+import socketserver
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import traceback
 import wave
+from collections.abc import Callable, Iterator
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import numpy as np
-import sounddevice as sd
+
+class _LazyModule:
+    """Module stand-in that imports ``name`` on first attribute access.
+
+    The import rebinds the module global ``alias`` to the real module, so
+    after the first use lookups cost the same as a top-level import.
+    """
+
+    def __init__(self, name: str, alias: str) -> None:
+        self._name = name
+        self._alias = alias
+
+    def __getattr__(self, attr: str) -> object:
+        module = importlib.import_module(self._name)
+        globals()[self._alias] = module
+        return getattr(module, attr)
+
+
+# The audio stack (numpy, sounddevice) is bound lazily here, and the heavier
+# stdlib modules (urllib.request, multiprocessing, sqlite3, ...) are imported
+# inside the functions that need them, so stop/toggle/status run on a small
+# stdlib import set.  Budget for an idle ``--mode status``: numpy must not show
+# up in ``python -X importtime`` and wall time stays ~95 ms (importing numpy
+# alone adds ~100 ms).  Keep module-level imports to the standard library.
+if TYPE_CHECKING:
+    import sqlite3
+
+    import numpy as np
+    import sounddevice as sd
+else:
+    np = _LazyModule("numpy", "np")
+    sd = _LazyModule("sounddevice", "sd")
 
 DEFAULT_MODEL = "small"
 DEFAULT_DURATION = 8.0
@@ -24,6 +72,9 @@ DEFAULT_STATE_DIR = Path.home() / ".cache" / "whisper-record-toggle"
 DEFAULT_WHISPERCPP_MODEL_DIR = Path.home() / "models" / "whisper.cpp"
 APP_NAME = "Whisper Record"
 DEFAULT_TOGGLE_DEBOUNCE = 0.0
+SERVER_SOCKET_NAME = "server.sock"
+CONTROL_SOCKET_NAME = "control.sock"
+WHISPER_SAMPLERATE = 16000
 
 
 def _append_log(state_dir: Path, message: str) -> None:
@@ -34,17 +85,149 @@ def _append_log(state_dir: Path, message: str) -> None:
         fh.write(f"[{timestamp}] {message}\n")
 
 
+_STAGE_STATE_DIR: Path | None = None
+_STAGE_ROLE = "cli"
+
+
+def _configure_stage_log(state_dir: Path, role: str) -> None:
+    """Route ``_log_stage``/``_timed_stage`` records to ``state_dir/worker.log``."""
+    global _STAGE_STATE_DIR, _STAGE_ROLE
+    _STAGE_STATE_DIR = state_dir
+    _STAGE_ROLE = role
+
+
+def _log_stage(stage: str, seconds: float, **fields: object) -> None:
+    """Append one JSON timing record for ``stage`` (see ``--mode stats``)."""
+    if _STAGE_STATE_DIR is None:
+        return
+    record: dict[str, object] = {
+        "event": "stage",
+        "stage": stage,
+        "ms": round(seconds * 1000.0, 2),
+        "role": _STAGE_ROLE,
+        "pid": os.getpid(),
+        "ts": round(time.time(), 3),
+    }
+    record.update(fields)
+    _append_log(_STAGE_STATE_DIR, json.dumps(record, sort_keys=False))
+
+
+@contextlib.contextmanager
+def _timed_stage(stage: str, **fields: object) -> Iterator[dict[str, object]]:
+    """Time the enclosed block with ``time.monotonic``; callers may add fields."""
+    started = time.monotonic()
+    try:
+        yield fields
+    except BaseException:
+        fields["failed"] = True
+        raise
+    finally:
+        _log_stage(stage, time.monotonic() - started, **fields)
+
+
 class Notifier:
-    """Best-effort desktop notifications with optional live updates."""
+    """Best-effort desktop notifications with optional live updates.
+
+    ``send`` only records the latest message; a background thread delivers it,
+    dropping updates superseded before they went out, so the recording loop
+    never waits on the notification daemon.  Messages are sent over the
+    freedesktop D-Bus interface when jeepney is installed, otherwise through
+    ``notify-send``.  Get the process-wide instance from ``_notifier()`` so
+    updates from every caller coalesce and replace the same notification.
+    """
 
-    def __init__(self) -> None:
-        self.enabled = shutil.which("notify-send") is not None
+    def __init__(self, enabled: bool = True) -> None:
+        self.use_dbus = importlib.util.find_spec("jeepney") is not None
+        self.enabled = enabled and (
+            self.use_dbus or shutil.which("notify-send") is not None
+        )
         self.notification_id: str | None = None
+        self._pending: tuple[str, str, int] | None = None
+        self._busy = False
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._dbus = None
 
     def send(self, title: str, body: str, timeout_ms: int = 1500) -> None:
         if not self.enabled:
             return
 
+        with self._condition:
+            self._pending = (title, body, timeout_ms)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+            self._condition.notify()
+
+    def flush(self, timeout: float = 2.0) -> None:
+        """Wait (bounded) until the latest message has been handed off."""
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while self._pending is not None or self._busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                self._condition.wait(remaining)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                title, body, timeout_ms = self._pending
+                self._pending = None
+                self._busy = True
+            try:
+                self._deliver(title, body, timeout_ms)
+            except Exception:
+                pass
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def _deliver(self, title: str, body: str, timeout_ms: int) -> None:
+        if self.use_dbus:
+            try:
+                self._deliver_dbus(title, body, timeout_ms)
+                return
+            except Exception:
+                self.use_dbus = False
+                if shutil.which("notify-send") is None:
+                    return
+        self._deliver_notify_send(title, body, timeout_ms)
+
+    def _deliver_dbus(self, title: str, body: str, timeout_ms: int) -> None:
+        from jeepney import DBusAddress, new_method_call
+        from jeepney.io.blocking import open_dbus_connection
+
+        if self._dbus is None:
+            self._dbus = open_dbus_connection(bus="SESSION")
+        address = DBusAddress(
+            "/org/freedesktop/Notifications",
+            bus_name="org.freedesktop.Notifications",
+            interface="org.freedesktop.Notifications",
+        )
+        message = new_method_call(
+            address,
+            "Notify",
+            "susssasa{sv}i",
+            (
+                APP_NAME,
+                int(self.notification_id or 0),
+                "",
+                title,
+                body,
+                [],
+                {"urgency": ("y", 1)},
+                timeout_ms,
+            ),
+        )
+        reply = self._dbus.send_and_get_reply(message, timeout=2.0)
+        self.notification_id = str(reply.body[0])
+
+    def _deliver_notify_send(self, title: str, body: str, timeout_ms: int) -> None:
         base_cmd = [
             "notify-send",
             "-a",
@@ -71,24 +254,97 @@ class Notifier:
             self.notification_id = notification_id
 
 
+_NOTIFIERS: dict[bool, Notifier] = {}
+_NOTIFIERS_LOCK = threading.Lock()
+
+
+def _notifier(enabled: bool = True) -> Notifier:
+    """Process-wide Notifier: one delivery thread, queue and replace-ID."""
+    with _NOTIFIERS_LOCK:
+        if enabled not in _NOTIFIERS:
+            _NOTIFIERS[enabled] = Notifier(enabled=enabled)
+        return _NOTIFIERS[enabled]
+
+
+class AudioBuffer:
+    """Preallocated int16 capture arena that grows geometrically up to a hard cap.
+
+    The audio callback copies each block into place instead of keeping a list
+    of per-block arrays, and readers get views rather than concatenated copies.
+    Samples already written are never moved in the live array; growth
+    allocates a larger array, so views taken earlier stay valid.
+    """
+
+    def __init__(
+        self,
+        samplerate: int,
+        channels: int,
+        max_seconds: float | None,
+        initial_seconds: float = 30.0,
+    ) -> None:
+        self.channels = channels
+        self.max_frames = int(max_seconds * samplerate) if max_seconds else None
+        initial = int(initial_seconds * samplerate)
+        if self.max_frames is not None:
+            initial = min(initial, self.max_frames)
+        self.data = np.empty((max(initial, 1), channels), dtype=np.int16)
+        self.length = 0
+        self.full = False
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.length
+
+    def write(self, block: np.ndarray) -> None:
+        with self.lock:
+            needed = self.length + len(block)
+            if self.max_frames is not None and needed > self.max_frames:
+                block = block[: self.max_frames - self.length]
+                needed = self.max_frames
+                self.full = True
+            if needed > len(self.data):
+                capacity = max(needed, len(self.data) * 2)
+                if self.max_frames is not None:
+                    capacity = min(capacity, self.max_frames)
+                grown = np.empty((capacity, self.channels), dtype=np.int16)
+                grown[: self.length] = self.data[: self.length]
+                self.data = grown
+            self.data[self.length : needed] = block
+            self.length = needed
+
+    def view(self, start: int = 0, end: int | None = None) -> np.ndarray:
+        with self.lock:
+            stop = self.length if end is None else min(end, self.length)
+            return self.data[start:stop]
+
+
 class Recorder:
     """Stream microphone audio into memory while tracking elapsed time."""
 
-    def __init__(self, samplerate: int, channels: int) -> None:
+    def __init__(
+        self, samplerate: int, channels: int, max_seconds: float | None = None
+    ) -> None:
         self.samplerate = samplerate
         self.channels = channels
-        self.frames: list[np.ndarray] = []
+        self.buffer = AudioBuffer(samplerate, channels, max_seconds)
 
     def _callback(self, indata: np.ndarray, _frames: int, _time, status) -> None:
         if status:
             print(f"sounddevice warning: {status}", file=sys.stderr)
-        self.frames.append(indata.copy())
+        self.buffer.write(indata)
 
     def record(
-        self, duration: float | None, notifier: Notifier, interval: float
+        self,
+        duration: float | None,
+        notifier: Notifier,
+        interval: float,
+        streamer: StreamingTranscriber | None = None,
+        stop_event: threading.Event | None = None,
+        on_started: Callable[[], None] | None = None,
     ) -> np.ndarray:
         start = time.monotonic()
         last_update = 0.0
+        stop_event = stop_event or threading.Event()
 
         with sd.InputStream(
             samplerate=self.samplerate,
@@ -96,6 +352,10 @@ class Recorder:
             dtype="int16",
             callback=self._callback,
         ):
+            opened = time.monotonic()
+            _log_stage("stream_open", opened - start)
+            if on_started is not None:
+                on_started()
             while True:
                 elapsed = time.monotonic() - start
                 if elapsed - last_update >= interval:
@@ -110,17 +370,263 @@ class Recorder:
                         )
                     last_update = elapsed
 
+                if streamer is not None:
+                    streamer.update(self.buffer)
+
                 if duration is not None and elapsed >= duration:
                     break
+                if self.buffer.full:
+                    notifier.send(
+                        "Recording", "Maximum duration reached, stopping", timeout_ms=1500
+                    )
+                    break
 
-                time.sleep(0.05)
+                if stop_event.wait(0.05):
+                    break
 
-        if not self.frames:
+        _log_stage(
+            "recording",
+            time.monotonic() - opened,
+            audio_seconds=round(len(self.buffer) / self.samplerate, 2),
+        )
+        if not len(self.buffer):
             raise RuntimeError(
                 "No audio captured. Check your input device and permissions."
             )
 
-        return np.concatenate(self.frames, axis=0)
+        return self.buffer.view()
+
+
+class CaptureDaemon:
+    """Keep the input stream open so recordings start instantly with pre-roll.
+
+    While idle the callback writes into a small ring buffer holding the last
+    ``preroll_seconds`` of audio.  ``start`` seeds a fresh AudioBuffer with the
+    ring contents, so speech from just before the keypress is kept.  Reaching
+    ``max_seconds`` ends the recording like ``Recorder.record`` does; the
+    finished audio waits for ``stop`` to collect it.
+    """
+
+    def __init__(
+        self,
+        samplerate: int,
+        channels: int,
+        preroll_seconds: float,
+        max_seconds: float | None,
+    ) -> None:
+        self.samplerate = samplerate
+        self.channels = channels
+        self.max_seconds = max_seconds
+        self.ring = np.zeros((max(int(preroll_seconds * samplerate), 1), channels), dtype=np.int16)
+        self.ring_pos = 0
+        self.ring_filled = 0
+        self.active: AudioBuffer | None = None
+        self.finished: AudioBuffer | None = None
+        self.lock = threading.Lock()
+        self.stream = sd.InputStream(
+            samplerate=samplerate,
+            channels=channels,
+            dtype="int16",
+            callback=self._callback,
+        )
+        self.stream.start()
+
+    @property
+    def recording(self) -> bool:
+        return self.active is not None or self.finished is not None
+
+    def _callback(self, indata: np.ndarray, _frames: int, _time, status) -> None:
+        if status:
+            print(f"sounddevice warning: {status}", file=sys.stderr)
+        with self.lock:
+            if self.active is None:
+                self._ring_write(indata)
+                return
+            self.active.write(indata)
+            if not self.active.full:
+                return
+            self.finished, self.active = self.active, None
+        _notifier().send("Recording", "Maximum duration reached, stopping", timeout_ms=1500)
+
+    def _ring_write(self, block: np.ndarray) -> None:
+        size = len(self.ring)
+        count = len(block)
+        if count >= size:
+            self.ring[:] = block[count - size :]
+            self.ring_pos = 0
+            self.ring_filled = size
+            return
+        first = min(count, size - self.ring_pos)
+        self.ring[self.ring_pos : self.ring_pos + first] = block[:first]
+        self.ring[: count - first] = block[first:]
+        self.ring_pos = (self.ring_pos + count) % size
+        self.ring_filled = min(self.ring_filled + count, size)
+
+    def _ring_contents(self) -> np.ndarray:
+        if self.ring_filled < len(self.ring):
+            return self.ring[: self.ring_filled]
+        return np.concatenate((self.ring[self.ring_pos :], self.ring[: self.ring_pos]))
+
+    def start(self) -> None:
+        with self.lock:
+            buffer = AudioBuffer(self.samplerate, self.channels, self.max_seconds)
+            buffer.write(self._ring_contents())
+            self.ring_pos = 0
+            self.ring_filled = 0
+            self.active = buffer
+
+    def stop(self) -> np.ndarray:
+        with self.lock:
+            buffer = self.active or self.finished
+            self.active = self.finished = None
+        if buffer is None:
+            raise RuntimeError("Capture daemon is not recording.")
+        return buffer.view()
+
+    def close(self) -> None:
+        self.stream.stop()
+        self.stream.close()
+
+
+def _quietest_cut(audio: np.ndarray, samplerate: int, search_seconds: float) -> int:
+    """Return a sample index inside the trailing search window with the least energy."""
+    window = max(int(samplerate * 0.02), 1)
+    search = min(len(audio), int(search_seconds * samplerate))
+    count = search // window
+    if count == 0:
+        return len(audio)
+    tail = audio[len(audio) - count * window :].astype(np.float32)
+    mono = tail.mean(axis=1) if tail.ndim == 2 else tail
+    energy = np.square(mono.reshape(count, window)).mean(axis=1)
+    quietest = int(np.argmin(energy))
+    return len(audio) - count * window + quietest * window + window // 2
+
+
+def _split_at_silence(
+    audio: np.ndarray, samplerate: int, chunk_seconds: float, overlap_seconds: float
+) -> list[tuple[int, int]]:
+    """Split into ~chunk_seconds spans cut at quiet points, padded by the overlap."""
+    target = max(int(chunk_seconds * samplerate), 1)
+    overlap = int(overlap_seconds * samplerate)
+    search_seconds = min(5.0, chunk_seconds / 4)
+    cuts = [0]
+    while len(audio) - cuts[-1] > target * 1.5:
+        window_end = cuts[-1] + target
+        cuts.append(
+            cuts[-1] + _quietest_cut(audio[cuts[-1] : window_end], samplerate, search_seconds)
+        )
+    cuts.append(len(audio))
+    return [
+        (max(start - overlap, 0), min(end + overlap, len(audio)))
+        for start, end in zip(cuts, cuts[1:])
+    ]
+
+
+def _merge_chunk_texts(
+    texts: list[str], max_overlap_words: int = 12, min_overlap_words: int = 2
+) -> str:
+    """Join chunk transcripts, dropping words repeated across a chunk overlap.
+
+    A single repeated word is left alone, since speech like "that that" or
+    "no no" is common; each chunk keeps its own whitespace and line breaks.
+    """
+    merged = ""
+    for text in texts:
+        text = text.strip()
+        if merged and text:
+            spans = list(re.finditer(r"\S+", text))[:max_overlap_words]
+            tail = [
+                word.strip(".,!?;:\"'").lower()
+                for word in re.findall(r"\S+", merged)[-max_overlap_words:]
+            ]
+            head = [match.group().strip(".,!?;:\"'").lower() for match in spans]
+            for size in range(min(len(tail), len(head)), min_overlap_words - 1, -1):
+                if tail[-size:] == head[:size]:
+                    text = text[spans[size - 1].end() :].lstrip()
+                    break
+        if text:
+            merged = f"{merged} {text}" if merged else text
+    return merged
+
+
+class StreamingTranscriber:
+    """Decode completed segments in a background thread while recording continues.
+
+    Once ``chunk_seconds`` of not-yet-submitted audio sits in the capture
+    buffer it is cut at the quietest point of its last
+    ``search_seconds`` so words are not split, and the head is queued for
+    transcription.  ``finish`` only has to decode whatever remains.
+    """
+
+    def __init__(
+        self,
+        transcribe_segment: Callable[[np.ndarray], str],
+        samplerate: int,
+        chunk_seconds: float,
+        search_seconds: float = 1.5,
+    ) -> None:
+        self.transcribe_segment = transcribe_segment
+        self.samplerate = samplerate
+        self.chunk_samples = max(int(chunk_seconds * samplerate), 1)
+        self.search_seconds = min(search_seconds, chunk_seconds / 2)
+        self.consumed = 0
+        self.segments = 0
+        self.texts: list[str] = []
+        self.error: BaseException | None = None
+        self.queue: list[np.ndarray | None] = []
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self.condition:
+                while not self.queue:
+                    self.condition.wait()
+                segment = self.queue.pop(0)
+            if segment is None:
+                return
+            if self.error is not None:
+                continue
+            try:
+                text = self.transcribe_segment(segment).strip()
+            except BaseException as exc:
+                self.error = exc
+                continue
+            if text:
+                self.texts.append(text)
+
+    def _submit(self, segment: np.ndarray | None) -> None:
+        with self.condition:
+            self.queue.append(segment)
+            self.condition.notify()
+
+    def update(self, buffer: AudioBuffer) -> None:
+        pending = buffer.view(self.consumed)
+        if len(pending) < self.chunk_samples:
+            return
+
+        cut = _quietest_cut(pending, self.samplerate, self.search_seconds)
+        self._submit(pending[:cut])
+        self.segments += 1
+        self.consumed += cut
+
+    def cancel(self) -> None:
+        with self.condition:
+            self.queue.clear()
+        self._submit(None)
+        self.thread.join()
+
+    def finish(self, buffer: AudioBuffer) -> str:
+        pending = buffer.view(self.consumed)
+        if len(pending):
+            self._submit(pending)
+            self.consumed += len(pending)
+        self._submit(None)
+        self.thread.join()
+        if self.error is not None:
+            raise RuntimeError(f"Streaming transcription failed: {self.error}") from self.error
+        return "\n".join(self.texts)
 
 
 def _format_seconds(value: float) -> str:
@@ -134,13 +640,574 @@ def write_wav(path: Path, audio: np.ndarray, samplerate: int, channels: int) ->
         wav_file.setnchannels(channels)
         wav_file.setsampwidth(2)
         wav_file.setframerate(samplerate)
-        wav_file.writeframes(audio.tobytes())
+        wav_file.writeframes(memoryview(np.ascontiguousarray(audio)).cast("B"))
+
+
+def _wav_bytes(audio: np.ndarray, samplerate: int, channels: int) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(samplerate)
+        wav_file.writeframes(memoryview(np.ascontiguousarray(audio)).cast("B"))
+    return buffer.getvalue()
+
+
+def _to_float32_mono(audio: np.ndarray, channels: int) -> np.ndarray:
+    samples = audio.reshape(-1, channels).astype(np.float32) / 32768.0
+    if channels > 1:
+        return samples.mean(axis=1)
+    return samples.reshape(-1)
+
+
+def _resample_windowed_sinc(
+    samples: np.ndarray,
+    samplerate: int,
+    target: int,
+    zero_crossings: int = 16,
+    block: int = 2048,
+) -> np.ndarray:
+    """Band-limited resampling of 1-D float audio without scipy.
+
+    Each output sample is a Kaiser-windowed sinc interpolation of the input
+    around its fractional source position, with the cutoff at the lower of
+    the two Nyquist frequencies.  For a reduced ratio ``up/down`` there are
+    only ``up`` distinct fractional positions, so the filter taps are built
+    once per phase and output samples are computed in blocks.
+    """
+    divisor = int(np.gcd(samplerate, target))
+    up, down = target // divisor, samplerate // divisor
+    cutoff = min(1.0, up / down)
+    half_width = int(np.ceil(zero_crossings / cutoff))
+    beta = 8.6
+
+    taps = np.arange(-half_width + 1, half_width + 1)
+    offsets = np.arange(up)[:, None] / up - taps[None, :]
+    window = np.i0(beta * np.sqrt(np.clip(1.0 - (offsets / half_width) ** 2, 0.0, 1.0)))
+    weights = (cutoff * np.sinc(cutoff * offsets) * window / np.i0(beta)).astype(np.float32)
+
+    padded = np.pad(samples.astype(np.float32), (half_width, half_width + 1))
+    out_len = -(-len(samples) * up // down)
+    out = np.empty(out_len, dtype=np.float32)
+    for start in range(0, out_len, block):
+        steps = np.arange(start, min(start + block, out_len), dtype=np.int64) * down
+        base, phase = np.divmod(steps, up)
+        indices = base[:, None] + (taps + half_width)[None, :]
+        out[start : start + len(steps)] = np.einsum(
+            "ij,ij->i", padded[indices], weights[phase]
+        )
+    return out
+
+
+def downmix_and_resample(
+    audio: np.ndarray, samplerate: int, channels: int, target: int
+) -> tuple[np.ndarray, int, int]:
+    """Downmix capture-format int16 audio to mono and resample it to ``target`` Hz.
+
+    Returns ``(audio, samplerate, channels)``; audio already in the target
+    format, or ``target`` <= 0, is passed through untouched.
+    """
+    if target <= 0 or (channels == 1 and samplerate == target):
+        return audio, samplerate, channels
+
+    samples = _to_float32_mono(audio, channels)
+    if samplerate != target:
+        try:
+            from scipy.signal import resample_poly
+        except ImportError:
+            samples = _resample_windowed_sinc(samples, samplerate, target)
+        else:
+            divisor = int(np.gcd(samplerate, target))
+            samples = resample_poly(samples, target // divisor, samplerate // divisor)
+    pcm = np.clip(np.rint(samples * 32768.0), -32768, 32767).astype(np.int16)
+    return pcm.reshape(-1, 1), target, 1
+
+
+def _energy_speech_bounds(
+    audio: np.ndarray, samplerate: int, channels: int, padding: float
+) -> tuple[int, int] | None:
+    """Locate speech with per-frame energy and zero-crossing rate.
+
+    The threshold follows the clip's own noise floor (10th percentile of frame
+    energy) plus a margin, clamped to a fixed dBFS range so fully voiced clips
+    and very quiet rooms both behave.  High zero-crossing frames slightly above
+    the floor count as speech to keep unvoiced consonants.
+    """
+    frame = max(int(samplerate * 0.03), 1)
+    count = len(audio) // frame
+    if count == 0:
+        return None
+    samples = audio[: count * frame].reshape(count, frame, channels).astype(np.float32)
+    mono = samples.mean(axis=2) / 32768.0
+    rms = np.sqrt(np.square(mono).mean(axis=1))
+    level_db = 20.0 * np.log10(np.maximum(rms, 1e-6))
+    signs = np.signbit(mono)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / frame
+
+    floor_db = float(np.percentile(level_db, 10))
+    threshold_db = min(max(floor_db + 12.0, -55.0), -35.0)
+    voiced = level_db > threshold_db
+    unvoiced = (zcr > 0.25) & (level_db > threshold_db - 6.0)
+    speech = np.flatnonzero(voiced | unvoiced)
+    # Require ~150 ms of speech frames before treating the clip as non-empty.
+    if len(speech) * frame < int(samplerate * 0.15):
+        return None
+
+    pad = int(padding * samplerate)
+    start = max(int(speech[0]) * frame - pad, 0)
+    end = min((int(speech[-1]) + 1) * frame + pad, len(audio))
+    return start, end
+
+
+_SILERO_MODEL: tuple[object, Callable[..., list[dict[str, int]]]] | None = None
+
+
+def _silero_speech_bounds(
+    audio: np.ndarray, samplerate: int, channels: int, padding: float
+) -> tuple[int, int] | None:
+    global _SILERO_MODEL
+    import torch
+
+    if samplerate not in (8000, 16000):
+        raise RuntimeError(f"silero VAD supports 8000/16000 Hz, got {samplerate} Hz")
+    if _SILERO_MODEL is None:
+        model, utils = torch.hub.load(
+            "snakers4/silero-vad", "silero_vad", trust_repo=True, verbose=False
+        )
+        _SILERO_MODEL = (model, utils[0])
+    model, get_speech_timestamps = _SILERO_MODEL
+    timestamps = get_speech_timestamps(
+        torch.from_numpy(_to_float32_mono(audio, channels)),
+        model,
+        sampling_rate=samplerate,
+    )
+    if not timestamps:
+        return None
+    pad = int(padding * samplerate)
+    return (
+        max(timestamps[0]["start"] - pad, 0),
+        min(timestamps[-1]["end"] + pad, len(audio)),
+    )
+
+
+def trim_silence(
+    audio: np.ndarray,
+    samplerate: int,
+    channels: int,
+    method: str,
+    padding: float,
+    state_dir: Path,
+) -> np.ndarray | None:
+    """Trim leading/trailing silence; None when the capture holds no speech."""
+    if method == "off":
+        return audio
+    bounds: tuple[int, int] | None
+    if method == "silero":
+        try:
+            bounds = _silero_speech_bounds(audio, samplerate, channels, padding)
+        except Exception as exc:
+            _append_log(state_dir, f"silero VAD unavailable, using energy VAD: {exc}")
+            bounds = _energy_speech_bounds(audio, samplerate, channels, padding)
+    else:
+        bounds = _energy_speech_bounds(audio, samplerate, channels, padding)
+    if bounds is None:
+        return None
+    return audio[bounds[0] : bounds[1]]
+
+
+class AudioClip:
+    """Captured PCM for one transcription, written out as a WAV file only on demand."""
+
+    def __init__(
+        self, audio: np.ndarray, samplerate: int, channels: int, scratch_dir: Path
+    ) -> None:
+        self.audio = audio
+        self.samplerate = samplerate
+        self.channels = channels
+        self.scratch_dir = scratch_dir
+        self._wav_bytes: bytes | None = None
+        self._wav_path: Path | None = None
+
+    def wav_bytes(self) -> bytes:
+        if self._wav_bytes is None:
+            self._wav_bytes = _wav_bytes(self.audio, self.samplerate, self.channels)
+        return self._wav_bytes
+
+    def wav_path(self) -> Path:
+        if self._wav_path is None:
+            self._wav_path = self.scratch_dir / "input.wav"
+            with _timed_stage("wav_write"):
+                write_wav(self._wav_path, self.audio, self.samplerate, self.channels)
+        return self._wav_path
+
+
+class TranscriptCache:
+    """Content-addressed transcript store with size-bounded LRU eviction.
+
+    Entries are ``<sha256>.txt`` files; a hit refreshes the file's mtime, and
+    the least recently used files are evicted once the directory exceeds
+    ``max_bytes``.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def for_args(cls, args: argparse.Namespace) -> TranscriptCache | None:
+        if args.cache_size_mb <= 0:
+            return None
+        return cls(
+            Path(args.state_dir) / "transcripts", int(args.cache_size_mb * 1024 * 1024)
+        )
+
+    @staticmethod
+    def key(clip: AudioClip, params: dict[str, object]) -> str:
+        digest = hashlib.sha256()
+        digest.update(memoryview(np.ascontiguousarray(clip.audio)).cast("B"))
+        digest.update(
+            json.dumps(
+                {**params, "samplerate": clip.samplerate, "channels": clip.channels},
+                sort_keys=True,
+            ).encode("utf-8")
+        )
+        return digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        path = self.directory / f"{key}.txt"
+        try:
+            text = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.directory / f"{key}.{os.getpid()}.tmp"
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, self.directory / f"{key}.txt")
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        for path in self.directory.glob("*.txt"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        entries.sort()
+        for _mtime, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+class RecordingArchive:
+    """Compressed copies of past captures with a SQLite index for re-transcription.
+
+    Audio is stored as FLAC or Opus under ``<state_dir>/archive``; ``index.sqlite3``
+    holds one ``recordings`` row per capture (timestamp, duration, backend,
+    model, transcript) and a ``transcripts`` row per later re-transcription.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS recordings (
+            id INTEGER PRIMARY KEY,
+            created REAL NOT NULL,
+            path TEXT NOT NULL,
+            duration REAL NOT NULL,
+            samplerate INTEGER NOT NULL,
+            backend TEXT NOT NULL,
+            model TEXT NOT NULL,
+            transcript TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS transcripts (
+            recording_id INTEGER NOT NULL REFERENCES recordings(id),
+            backend TEXT NOT NULL,
+            model TEXT NOT NULL,
+            created REAL NOT NULL,
+            transcript TEXT NOT NULL,
+            PRIMARY KEY (recording_id, backend, model)
+        );
+    """
+
+    def __init__(self, directory: Path, audio_format: str) -> None:
+        self.directory = directory
+        self.audio_format = audio_format
+        self.index_path = directory / "index.sqlite3"
+
+    @classmethod
+    def for_args(cls, args: argparse.Namespace) -> RecordingArchive | None:
+        if not args.archive:
+            return None
+        return cls(Path(args.state_dir) / "archive", args.archive_format)
+
+    def _connect(self) -> sqlite3.Connection:
+        import sqlite3
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.index_path, timeout=30.0)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(self.SCHEMA)
+        return conn
+
+    def add(
+        self,
+        audio: np.ndarray,
+        samplerate: int,
+        channels: int,
+        backend: str,
+        model: str,
+        transcript: str,
+    ) -> int:
+        import uuid
+
+        created = time.time()
+        name = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(created))}-{uuid.uuid4().hex[:8]}"
+        path = self.directory / f"{name}.{self.audio_format}"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        _encode_audio(path, audio, samplerate, channels)
+        with contextlib.closing(self._connect()) as conn, conn:
+            cursor = conn.execute(
+                "INSERT INTO recordings (created, path, duration, samplerate, backend, model, transcript)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (created, path.name, len(audio) / samplerate, samplerate, backend, model, transcript),
+            )
+            return int(cursor.lastrowid)
+
+    def recordings(self) -> list[sqlite3.Row]:
+        with contextlib.closing(self._connect()) as conn:
+            return conn.execute("SELECT * FROM recordings ORDER BY id").fetchall()
+
+    def transcribed_ids(self, backend: str, model: str) -> set[int]:
+        with contextlib.closing(self._connect()) as conn:
+            return {
+                row[0]
+                for row in conn.execute(
+                    "SELECT recording_id FROM transcripts WHERE backend = ? AND model = ?",
+                    (backend, model),
+                )
+            }
+
+    def load(self, row: sqlite3.Row) -> np.ndarray:
+        return _decode_audio(self.directory / row["path"], int(row["samplerate"]))
+
+    def add_transcript(self, recording_id: int, backend: str, model: str, transcript: str) -> None:
+        with contextlib.closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO transcripts (recording_id, backend, model, created, transcript)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (recording_id, backend, model, time.time(), transcript),
+            )
+
+
+def _encode_audio(path: Path, audio: np.ndarray, samplerate: int, channels: int) -> None:
+    """Write int16 PCM as FLAC/Opus with soundfile, or the ffmpeg CLI without it."""
+    try:
+        import soundfile
+    except ImportError:
+        soundfile = None
+    if soundfile is not None:
+        if path.suffix == ".opus":
+            soundfile.write(path, audio, samplerate, format="OGG", subtype="OPUS")
+        else:
+            soundfile.write(path, audio, samplerate, format="FLAC")
+        return
+
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        raise RuntimeError(
+            "Archiving recordings needs soundfile (pip install soundfile) or ffmpeg in PATH."
+        )
+    codec = ["-c:a", "libopus", "-b:a", "24k"] if path.suffix == ".opus" else ["-c:a", "flac"]
+    cmd = [
+        ffmpeg,
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-y",
+        "-f",
+        "s16le",
+        "-ar",
+        str(samplerate),
+        "-ac",
+        str(channels),
+        "-i",
+        "-",
+        *codec,
+        str(path),
+    ]
+    result = subprocess.run(
+        cmd, input=memoryview(np.ascontiguousarray(audio)).cast("B"), capture_output=True
+    )
+    if result.returncode != 0:
+        details = result.stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(details or f"ffmpeg failed to encode {path.name}.")
+
+
+def _decode_audio(path: Path, samplerate: int) -> np.ndarray:
+    """Read an archived recording back as int16 PCM at ``samplerate``."""
+    try:
+        import soundfile
+    except ImportError:
+        soundfile = None
+    if soundfile is not None:
+        audio, _ = soundfile.read(path, dtype="int16", always_2d=True)
+        return audio
+
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        raise RuntimeError(
+            "Reading archived recordings needs soundfile (pip install soundfile) or ffmpeg in PATH."
+        )
+    cmd = [
+        ffmpeg,
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-i",
+        str(path),
+        "-f",
+        "s16le",
+        "-ac",
+        "1",
+        "-ar",
+        str(samplerate),
+        "-",
+    ]
+    result = subprocess.run(cmd, capture_output=True)
+    if result.returncode != 0:
+        details = result.stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(details or f"ffmpeg failed to decode {path.name}.")
+    return np.frombuffer(result.stdout, dtype=np.int16).reshape(-1, 1)
+
+
+def _archive_in_background(
+    archive: RecordingArchive | None,
+    args: argparse.Namespace,
+    model_name_or_path: str,
+    audio: np.ndarray,
+    samplerate: int,
+    channels: int,
+    transcript: str,
+) -> None:
+    """Compress and index a capture off the latency path.
+
+    The thread is non-daemon, so the process finishes the write before it
+    exits even though the transcript has already been handed out.
+    """
+    if archive is None or not len(audio):
+        return
+    threading.Thread(
+        target=_archive_recording,
+        args=(archive, args, model_name_or_path, audio, samplerate, channels, transcript),
+        name="archive",
+    ).start()
+
+
+def _archive_recording(
+    archive: RecordingArchive,
+    args: argparse.Namespace,
+    model_name_or_path: str,
+    audio: np.ndarray,
+    samplerate: int,
+    channels: int,
+    transcript: str,
+) -> None:
+    try:
+        with _timed_stage("archive", format=archive.audio_format):
+            prepared, rate, count = downmix_and_resample(
+                audio, samplerate, channels, args.target_samplerate
+            )
+            archive.add(prepared, rate, count, args.backend, model_name_or_path, transcript)
+    except Exception as exc:
+        _append_log(Path(args.state_dir), f"archive failed: {exc}")
+
+
+def _scratch_directory() -> tempfile.TemporaryDirectory[str]:
+    # Prefer RAM-backed locations so fallback WAV and transcript files never hit disk.
+    for candidate in (os.environ.get("XDG_RUNTIME_DIR"), "/dev/shm"):
+        if candidate and os.path.isdir(candidate) and os.access(candidate, os.W_OK):
+            return tempfile.TemporaryDirectory(prefix="whisper-audio-", dir=candidate)
+    return tempfile.TemporaryDirectory(prefix="whisper-audio-")
 
 
 def transcribe(
     backend: str,
     model_name_or_path: str,
-    wav_path: Path,
+    clip: AudioClip,
+    notifier: Notifier,
+    device: str,
+    compute_type: str,
+    beam_size: int,
+    task: str,
+    language: str | None,
+    whisperx_mode: str,
+    whisperx_vad_method: str,
+    whisperx_hf_token: str | None,
+    whisperx_min_speakers: int | None,
+    whisperx_max_speakers: int | None,
+    audio_transport: str = "pipe",
+    cache: TranscriptCache | None = None,
+    threads: int | None = None,
+) -> str:
+    cache_key: str | None = None
+    if cache is not None:
+        params: dict[str, object] = {
+            "backend": backend,
+            "model": model_name_or_path,
+            "task": task,
+            "language": language,
+            "beam_size": beam_size,
+            "compute_type": compute_type,
+        }
+        if backend == "whisperx":
+            params.update(
+                whisperx_mode=whisperx_mode,
+                whisperx_vad_method=whisperx_vad_method,
+                whisperx_min_speakers=whisperx_min_speakers,
+                whisperx_max_speakers=whisperx_max_speakers,
+            )
+        cache_key = TranscriptCache.key(clip, params)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            notifier.send("Transcribing", "Using cached transcript", timeout_ms=1000)
+            return cached
+
+    with _timed_stage("backend", backend=backend, model=model_name_or_path):
+        text = _dispatch_transcribe(
+            backend=backend,
+            model_name_or_path=model_name_or_path,
+            clip=clip,
+            notifier=notifier,
+            device=device,
+            compute_type=compute_type,
+            beam_size=beam_size,
+            task=task,
+            language=language,
+            whisperx_mode=whisperx_mode,
+            whisperx_vad_method=whisperx_vad_method,
+            whisperx_hf_token=whisperx_hf_token,
+            whisperx_min_speakers=whisperx_min_speakers,
+            whisperx_max_speakers=whisperx_max_speakers,
+            audio_transport=audio_transport,
+            cache=cache,
+            threads=threads,
+        )
+    if cache is not None and cache_key is not None:
+        cache.put(cache_key, text)
+    return text
+
+
+def _dispatch_transcribe(
+    backend: str,
+    model_name_or_path: str,
+    clip: AudioClip,
     notifier: Notifier,
     device: str,
     compute_type: str,
@@ -152,32 +1219,38 @@ def transcribe(
     whisperx_hf_token: str | None,
     whisperx_min_speakers: int | None,
     whisperx_max_speakers: int | None,
+    audio_transport: str,
+    cache: TranscriptCache | None,
+    threads: int | None = None,
 ) -> str:
     if backend == "whispercpp":
         return transcribe_whispercpp(
             model_name_or_path=model_name_or_path,
-            wav_path=wav_path,
+            clip=clip,
             notifier=notifier,
             device=device,
             beam_size=beam_size,
             task=task,
             language=language,
+            audio_transport=audio_transport,
+            threads=threads,
         )
     if backend == "ctranslate2":
         return transcribe_ctranslate2(
             model_name_or_path=model_name_or_path,
-            wav_path=wav_path,
+            clip=clip,
             notifier=notifier,
             device=device,
             compute_type=compute_type,
             beam_size=beam_size,
             task=task,
             language=language,
+            threads=threads,
         )
     if backend == "whisperx":
         return transcribe_whisperx(
             model_name_or_path=model_name_or_path,
-            wav_path=wav_path,
+            clip=clip,
             notifier=notifier,
             device=device,
             compute_type=compute_type,
@@ -189,6 +1262,7 @@ def transcribe(
             whisperx_hf_token=whisperx_hf_token,
             whisperx_min_speakers=whisperx_min_speakers,
             whisperx_max_speakers=whisperx_max_speakers,
+            cache=cache,
         )
     raise RuntimeError(f"Unsupported backend: {backend}")
 
@@ -214,45 +1288,77 @@ def _resolve_whispercpp_model(model_name_or_path: str) -> Path:
     )
 
 
+# whisper-cli binaries seen rejecting "-f -" (builds without stdin input).
+_WHISPERCPP_NO_STDIN: set[str] = set()
+
+
+def _rejects_stdin_input(stderr: str) -> bool:
+    # Such builds treat "-" as a file name and fail before loading the model:
+    # "input file not found '-'", "failed to open '-' as WAV file", ...
+    return re.search(r"error: [^\n]*'-'", stderr) is not None
+
+
 def transcribe_whispercpp(
     model_name_or_path: str,
-    wav_path: Path,
+    clip: AudioClip,
     notifier: Notifier,
     device: str,
     beam_size: int,
     task: str,
     language: str | None,
+    audio_transport: str = "pipe",
+    threads: int | None = None,
 ) -> str:
     whisper_cli = shutil.which("whisper-cli")
     if not whisper_cli:
         raise RuntimeError("whisper-cli not found in PATH. Install whisper.cpp.")
 
     model_path = _resolve_whispercpp_model(model_name_or_path)
-    output_prefix = wav_path.parent / wav_path.stem
-    output_txt = Path(f"{output_prefix}.txt")
-    if output_txt.exists():
-        output_txt.unlink()
 
     notifier.send("Transcribing", "Running whisper.cpp...", timeout_ms=1500)
-    cmd = [
+    base_cmd = [
         whisper_cli,
-        "-f",
-        str(wav_path),
         "-m",
         str(model_path),
-        "-otxt",
-        "-of",
-        str(output_prefix),
         "-bs",
         str(beam_size),
         "-np",
     ]
     if device == "cpu":
-        cmd.append("-ng")
+        base_cmd.append("-ng")
     if language:
-        cmd.extend(["-l", language])
+        base_cmd.extend(["-l", language])
     if task == "translate":
-        cmd.append("-tr")
+        base_cmd.append("-tr")
+    if threads:
+        base_cmd.extend(["-t", str(threads)])
+
+    if audio_transport == "pipe" and whisper_cli not in _WHISPERCPP_NO_STDIN:
+        # Feed the WAV on stdin and read the plain-text transcript from stdout.
+        result = subprocess.run(
+            [*base_cmd, "-f", "-", "-nt"], input=clip.wav_bytes(), capture_output=True
+        )
+        if result.returncode == 0:
+            return result.stdout.decode("utf-8", errors="replace").strip()
+        stderr = result.stderr.decode("utf-8", errors="replace")
+        if not _rejects_stdin_input(stderr):
+            details = (stderr or result.stdout.decode("utf-8", errors="replace")).strip()
+            raise RuntimeError(details or "whisper.cpp failed.")
+        # Older whisper-cli builds cannot read stdin; use a WAV file from now on.
+        _WHISPERCPP_NO_STDIN.add(whisper_cli)
+
+    output_prefix = clip.scratch_dir / "input"
+    output_txt = Path(f"{output_prefix}.txt")
+    if output_txt.exists():
+        output_txt.unlink()
+    cmd = [
+        *base_cmd,
+        "-f",
+        str(clip.wav_path()),
+        "-otxt",
+        "-of",
+        str(output_prefix),
+    ]
 
     result = subprocess.run(cmd, capture_output=True, text=True)
     if result.returncode != 0:
@@ -269,13 +1375,14 @@ def transcribe_whispercpp(
 
 def transcribe_ctranslate2(
     model_name_or_path: str,
-    wav_path: Path,
+    clip: AudioClip,
     notifier: Notifier,
     device: str,
     compute_type: str,
     beam_size: int,
     task: str,
     language: str | None,
+    threads: int | None = None,
 ) -> str:
     whisper_cli = shutil.which("whisper-ctranslate2")
     if not whisper_cli:
@@ -290,7 +1397,8 @@ def transcribe_ctranslate2(
         )
 
     notifier.send("Transcribing", "Running whisper-ctranslate2...", timeout_ms=1500)
-    output_dir = wav_path.parent
+    wav_path = clip.wav_path()
+    output_dir = clip.scratch_dir
     output_txt = output_dir / f"{wav_path.stem}.txt"
     if output_txt.exists():
         output_txt.unlink()
@@ -315,6 +1423,8 @@ def transcribe_ctranslate2(
     ]
     if language:
         cmd.extend(["--language", language])
+    if threads:
+        cmd.extend(["--threads", str(threads)])
     model_dir_candidate = Path(model_name_or_path).expanduser()
     if model_dir_candidate.exists() and model_dir_candidate.is_dir():
         cmd.extend(["--model_directory", str(model_dir_candidate)])
@@ -338,7 +1448,7 @@ def transcribe_ctranslate2(
 
 def transcribe_whisperx(
     model_name_or_path: str,
-    wav_path: Path,
+    clip: AudioClip,
     notifier: Notifier,
     device: str,
     compute_type: str,
@@ -350,19 +1460,68 @@ def transcribe_whisperx(
     whisperx_hf_token: str | None,
     whisperx_min_speakers: int | None,
     whisperx_max_speakers: int | None,
+    cache: TranscriptCache | None = None,
 ) -> str:
+    import concurrent.futures
+
+    if task == "translate" and not language:
+        raise RuntimeError("Translation requires --language so WhisperX can translate from the source language.")
+
+    native_key: str | None = None
+    if whisperx_mode == "full" and cache is not None:
+        native_key = TranscriptCache.key(
+            clip,
+            {
+                "backend": "whisperx",
+                "stage": "native",
+                "model": model_name_or_path,
+                "language": language,
+                "beam_size": beam_size,
+                "compute_type": compute_type,
+                "whisperx_vad_method": whisperx_vad_method,
+            },
+        )
+
+    if whisperx_mode == "full" and importlib.util.find_spec("whisperx") is not None:
+        # One process, one model load, one decoded waveform: the native pass is
+        # reused for alignment and diarization instead of running the CLI twice.
+        notifier.send("Transcribing", "Running WhisperX full pipeline in-process...", timeout_ms=1500)
+        pipeline = WhisperXPipeline(
+            model_name_or_path,
+            device=device,
+            compute_type=compute_type,
+            beam_size=beam_size,
+            language=language,
+            whisperx_mode=whisperx_mode,
+            whisperx_vad_method=whisperx_vad_method,
+            whisperx_hf_token=whisperx_hf_token,
+            whisperx_min_speakers=whisperx_min_speakers,
+            whisperx_max_speakers=whisperx_max_speakers,
+        )
+        if clip.samplerate != WHISPER_SAMPLERATE:
+            samples = pipeline.whisperx.load_audio(str(clip.wav_path()))
+        else:
+            samples = _to_float32_mono(clip.audio, clip.channels)
+        text = pipeline.run(samples, task=task, language=language)
+        if cache is not None and native_key is not None:
+            cache.put(native_key, pipeline.native_text)
+        return text
+
     whisperx_cli = shutil.which("whisperx")
     if not whisperx_cli:
         raise RuntimeError("whisperx not found in PATH. Install with: pip install whisperx")
 
-    output_txt = wav_path.parent / f"{wav_path.stem}.txt"
+    wav_path = clip.wav_path()
+    output_txt = clip.scratch_dir / f"{wav_path.stem}.txt"
     if output_txt.exists():
         output_txt.unlink()
 
-    if task == "translate" and not language:
-        raise RuntimeError("Translation requires --language so WhisperX can translate from the source language.")
-
-    def _run_whisperx(out_dir: Path, job_task: str, full_mode: bool) -> tuple[int, str]:
+    def _run_whisperx(
+        out_dir: Path,
+        job_task: str,
+        full_mode: bool,
+        cpus: list[int] | None = None,
+    ) -> tuple[int, str]:
         cmd = [
             whisperx_cli,
             str(wav_path),
@@ -387,6 +1546,8 @@ def transcribe_whisperx(
         ]
         if language:
             cmd.extend(["--language", language])
+        if cpus:
+            cmd.extend(["--threads", str(len(cpus))])
 
         model_dir_candidate = Path(model_name_or_path).expanduser()
         if model_dir_candidate.exists() and model_dir_candidate.is_dir():
@@ -406,21 +1567,55 @@ def transcribe_whisperx(
             if whisperx_max_speakers is not None:
                 cmd.extend(["--max_speakers", str(whisperx_max_speakers)])
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        details = (result.stderr or result.stdout or "").strip()
-        return result.returncode, details
+        # preexec_fn is unsafe here (two passes are spawned from pool threads),
+        # so taskset applies the mask from exec when available; otherwise it is
+        # set right after the spawn, and --threads still sizes the pools.
+        taskset = shutil.which("taskset") if cpus else None
+        if taskset:
+            cmd = [taskset, "-c", ",".join(str(cpu) for cpu in cpus), *cmd]
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
+        if cpus and not taskset:
+            try:
+                os.sched_setaffinity(process.pid, cpus)
+            except OSError:
+                pass
+        stdout, stderr = process.communicate()
+        details = (stderr or stdout or "").strip()
+        return process.returncode, details
 
     notifier.send("Transcribing", "Running WhisperX...", timeout_ms=1500)
 
-    if whisperx_mode == "full":
-        native_dir = wav_path.parent / "whisperx-native"
+    if whisperx_mode != "full":
+        rc, details = _run_whisperx(clip.scratch_dir, task, full_mode=False)
+    elif native_key is not None and cache is not None and cache.get(native_key) is not None:
+        rc, details = _run_whisperx(clip.scratch_dir, task, full_mode=True)
+    else:
+        # Without the whisperx package both CLI stages still need their own
+        # model load, so run them side by side on disjoint halves of the CPUs.
+        native_dir = clip.scratch_dir / "whisperx-native"
         native_dir.mkdir(parents=True, exist_ok=True)
-        notifier.send("Transcribing", "WhisperX full mode: extracting native subtitles", timeout_ms=1500)
-        rc, details = _run_whisperx(native_dir, "transcribe", full_mode=False)
-        if rc != 0:
-            raise RuntimeError(details or "WhisperX native transcription stage failed.")
+        notifier.send("Transcribing", "WhisperX full mode: native and diarized passes in parallel", timeout_ms=1500)
+        available = sorted(os.sched_getaffinity(0))
+        half = max(len(available) // 2, 1)
+        native_cpus = available[:half]
+        main_cpus = available[half:] or available
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+            native_future = pool.submit(
+                _run_whisperx, native_dir, "transcribe", False, native_cpus
+            )
+            main_future = pool.submit(
+                _run_whisperx, clip.scratch_dir, task, True, main_cpus
+            )
+            native_rc, native_details = native_future.result()
+            rc, details = main_future.result()
+        if native_rc != 0:
+            raise RuntimeError(native_details or "WhisperX native transcription stage failed.")
+        native_txt = native_dir / f"{wav_path.stem}.txt"
+        if cache is not None and native_key is not None and native_txt.exists():
+            cache.put(native_key, native_txt.read_text(encoding="utf-8").strip())
 
-    rc, details = _run_whisperx(wav_path.parent, task, full_mode=(whisperx_mode == "full"))
     if rc != 0:
         raise RuntimeError(details or "whisperx failed.")
     if not output_txt.exists():
@@ -431,73 +1626,1709 @@ def transcribe_whisperx(
     return output_txt.read_text(encoding="utf-8").strip()
 
 
-def _type_with_tool(text: str) -> None:
-    if shutil.which("wtype"):
-        subprocess.run(["wtype", text], check=True)
-        return
-    if shutil.which("ydotool"):
-        subprocess.run(["ydotool", "type", "--", text], check=True)
-        return
-    if shutil.which("xdotool"):
-        subprocess.run(["xdotool", "type", "--clearmodifiers", "--", text], check=True)
-        return
+def _resolve_torch_device(device: str, compute_type: str) -> tuple[str, str]:
+    if device == "auto":
+        try:
+            import torch
+
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        except ImportError:
+            device = "cpu"
+    if compute_type == "auto":
+        compute_type = "float16" if device == "cuda" else "int8"
+    return device, compute_type
+
+
+class ResidentBackend(abc.ABC):
+    """A whisper model kept loaded in memory between transcription requests."""
+
+    @abc.abstractmethod
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        samplerate: int,
+        channels: int,
+        task: str,
+        language: str | None,
+    ) -> str:
+        """Transcribe int16 PCM at any rate and channel count."""
+
+    def close(self) -> None:
+        pass
+
+
+class FasterWhisperResident(ResidentBackend):
+    """faster-whisper model loaded in-process (same engine as whisper-ctranslate2)."""
+
+    def __init__(
+        self, model_name_or_path: str, device: str, compute_type: str, beam_size: int
+    ) -> None:
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError as exc:
+            raise RuntimeError(
+                "Resident ctranslate2 backend requires faster-whisper. "
+                "Install with: pip install faster-whisper"
+            ) from exc
+
+        if model_name_or_path.endswith(".bin"):
+            raise RuntimeError(
+                "faster-whisper/ctranslate2 does not use ggml .bin models. "
+                "Use a model name like 'small' or a CTranslate2 model directory."
+            )
+        self.beam_size = beam_size
+        self.model = WhisperModel(
+            model_name_or_path, device=device, compute_type=compute_type
+        )
+
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        samplerate: int,
+        channels: int,
+        task: str,
+        language: str | None,
+    ) -> str:
+        audio, _samplerate, channels = downmix_and_resample(
+            audio, samplerate, channels, WHISPER_SAMPLERATE
+        )
+        segments, _info = self.model.transcribe(
+            _to_float32_mono(audio, channels),
+            beam_size=self.beam_size,
+            task=task,
+            language=language,
+        )
+        return "\n".join(segment.text.strip() for segment in segments).strip()
+
+
+def _whisperx_text(segments: list[dict[str, object]]) -> str:
+    # Same layout as the whisperx CLI txt writer, including speaker labels.
+    lines = []
+    for segment in segments:
+        text = str(segment["text"]).strip()
+        if "speaker" in segment:
+            text = f"[{segment['speaker']}]: {text}"
+        lines.append(text)
+    return "\n".join(lines).strip()
+
+
+class WhisperXPipeline:
+    """WhisperX ASR, alignment and diarization models loaded in-process.
+
+    A single ASR pass feeds both the native transcript and the
+    alignment/diarization steps; translation adds one more decode of the same
+    in-memory audio with the already loaded model.
+    """
+
+    def __init__(
+        self,
+        model_name_or_path: str,
+        device: str,
+        compute_type: str,
+        beam_size: int,
+        language: str | None,
+        whisperx_mode: str,
+        whisperx_vad_method: str,
+        whisperx_hf_token: str | None = None,
+        whisperx_min_speakers: int | None = None,
+        whisperx_max_speakers: int | None = None,
+    ) -> None:
+        try:
+            import whisperx
+        except ImportError as exc:
+            raise RuntimeError(
+                "In-process WhisperX requires the whisperx Python package. "
+                "Install with: pip install whisperx"
+            ) from exc
+
+        self.whisperx = whisperx
+        self.device, compute_type = _resolve_torch_device(device, compute_type)
+        self.whisperx_mode = whisperx_mode
+        self.hf_token = whisperx_hf_token
+        self.min_speakers = whisperx_min_speakers
+        self.max_speakers = whisperx_max_speakers
+        self.align_models: dict[str, tuple[object, object]] = {}
+        self.diarize_model: object | None = None
+        self.native_text = ""
+        model_dir_candidate = Path(model_name_or_path).expanduser()
+        load_kwargs: dict[str, object] = {}
+        if model_dir_candidate.exists() and model_dir_candidate.is_dir():
+            load_kwargs["download_root"] = str(model_dir_candidate)
+        self.model = whisperx.load_model(
+            model_name_or_path,
+            self.device,
+            compute_type=compute_type,
+            language=language,
+            asr_options={"beam_size": beam_size},
+            vad_method=whisperx_vad_method,
+            **load_kwargs,
+        )
+
+    def _align_model(self, language: str) -> tuple[object, object]:
+        if language not in self.align_models:
+            self.align_models[language] = self.whisperx.load_align_model(
+                language_code=language, device=self.device
+            )
+        return self.align_models[language]
+
+    def _diarize(self, samples: np.ndarray, segments: list[dict[str, object]]) -> list[dict[str, object]]:
+        if self.diarize_model is None:
+            try:
+                from whisperx.diarize import DiarizationPipeline
+            except ImportError:
+                DiarizationPipeline = self.whisperx.DiarizationPipeline
+            self.diarize_model = DiarizationPipeline(
+                use_auth_token=self.hf_token, device=self.device
+            )
+        diarize_segments = self.diarize_model(
+            samples, min_speakers=self.min_speakers, max_speakers=self.max_speakers
+        )
+        return self.whisperx.assign_word_speakers(
+            diarize_segments, {"segments": segments}
+        )["segments"]
+
+    def run(self, samples: np.ndarray, task: str, language: str | None) -> str:
+        full = self.whisperx_mode == "full"
+        native = self.model.transcribe(
+            samples, language=language, task="transcribe" if full else task
+        )
+        self.native_text = _whisperx_text(native["segments"])
+        if full and task != "transcribe":
+            result = self.model.transcribe(samples, language=language, task=task)
+        else:
+            result = native
+
+        segments = result["segments"]
+        if self.whisperx_mode != "basic" and task == "transcribe" and segments:
+            align_model, metadata = self._align_model(result["language"])
+            segments = self.whisperx.align(
+                segments,
+                align_model,
+                metadata,
+                samples,
+                self.device,
+                return_char_alignments=False,
+            )["segments"]
+        if full and segments:
+            segments = self._diarize(samples, segments)
+        return _whisperx_text(segments)
+
+
+class WhisperXResident(ResidentBackend):
+    """WhisperX pipeline kept loaded between requests."""
+
+    def __init__(self, **pipeline_options: object) -> None:
+        self.pipeline = WhisperXPipeline(**pipeline_options)
+
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        samplerate: int,
+        channels: int,
+        task: str,
+        language: str | None,
+    ) -> str:
+        audio, _samplerate, channels = downmix_and_resample(
+            audio, samplerate, channels, WHISPER_SAMPLERATE
+        )
+        return self.pipeline.run(
+            _to_float32_mono(audio, channels), task=task, language=language
+        )
+
+
+class WhisperCppResident(ResidentBackend):
+    """A whisper.cpp ``whisper-server`` child process with the model preloaded."""
+
+    def __init__(self, model_name_or_path: str, device: str, beam_size: int) -> None:
+        whisper_server = shutil.which("whisper-server")
+        if not whisper_server:
+            raise RuntimeError(
+                "whisper-server not found in PATH. Install whisper.cpp with the server example."
+            )
+
+        model_path = _resolve_whispercpp_model(model_name_or_path)
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+
+        cmd = [
+            whisper_server,
+            "-m",
+            str(model_path),
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "-bs",
+            str(beam_size),
+        ]
+        if device == "cpu":
+            cmd.append("-ng")
+        self.process = subprocess.Popen(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+        )
+        self._wait_ready(timeout=120.0)
+
+    def _wait_ready(self, timeout: float) -> None:
+        import urllib.error
+        import urllib.request
+
+        # One-time wait while whisper-server loads the model.
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                details = (self.process.stderr.read() if self.process.stderr else "").strip()
+                raise RuntimeError(details or "whisper-server exited during startup.")
+            try:
+                with urllib.request.urlopen(self.base_url + "/", timeout=1.0):
+                    return
+            except (urllib.error.URLError, ConnectionError, TimeoutError):
+                time.sleep(0.2)
+        self.close()
+        raise RuntimeError("Timed out waiting for whisper-server to load the model.")
+
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        samplerate: int,
+        channels: int,
+        task: str,
+        language: str | None,
+    ) -> str:
+        import urllib.error
+        import urllib.request
+        import uuid
+
+        # whisper-server decodes at 16 kHz mono and does not convert itself.
+        audio, samplerate, channels = downmix_and_resample(
+            audio, samplerate, channels, WHISPER_SAMPLERATE
+        )
+        fields = {
+            "response_format": "json",
+            "translate": "true" if task == "translate" else "false",
+            "language": language or "auto",
+        }
+        boundary = uuid.uuid4().hex
+        parts: list[bytes] = []
+        for name, value in fields.items():
+            parts.append(
+                f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+            )
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="input.wav"\r\n'
+            "Content-Type: audio/wav\r\n\r\n".encode()
+        )
+        parts.append(_wav_bytes(audio, samplerate, channels))
+        parts.append(f"\r\n--{boundary}--\r\n".encode())
+        request = urllib.request.Request(
+            self.base_url + "/inference",
+            data=b"".join(parts),
+            headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+        )
+        try:
+            with urllib.request.urlopen(request) as response:
+                payload = json.load(response)
+        except urllib.error.HTTPError as exc:
+            raise RuntimeError(f"whisper-server failed: HTTP {exc.code}") from exc
+        if "error" in payload:
+            raise RuntimeError(f"whisper-server failed: {payload['error']}")
+        return str(payload.get("text", "")).strip()
+
+    def close(self) -> None:
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+
+def load_resident_backend(
+    args: argparse.Namespace, model_name_or_path: str
+) -> ResidentBackend:
+    if args.backend == "whispercpp":
+        return WhisperCppResident(model_name_or_path, args.device, args.beam_size)
+    if args.backend == "ctranslate2":
+        return FasterWhisperResident(
+            model_name_or_path, args.device, args.compute_type, args.beam_size
+        )
+    if args.backend == "whisperx":
+        return WhisperXResident(
+            model_name_or_path=model_name_or_path,
+            device=args.device,
+            compute_type=args.compute_type,
+            beam_size=args.beam_size,
+            language=args.language,
+            whisperx_mode=args.whisperx_mode,
+            whisperx_vad_method=args.whisperx_vad_method,
+            whisperx_hf_token=args.whisperx_hf_token,
+            whisperx_min_speakers=args.whisperx_min_speakers,
+            whisperx_max_speakers=args.whisperx_max_speakers,
+        )
+    raise RuntimeError(f"Unsupported backend: {args.backend}")
+
+
+def _server_config(args: argparse.Namespace, model_name_or_path: str) -> dict[str, object]:
+    # Requests are only served when the client wants the model and settings the
+    # server holds.  The HF token is compared by digest so pings don't echo it.
+    hf_token = args.whisperx_hf_token
+    return {
+        "backend": args.backend,
+        "model": model_name_or_path,
+        "device": args.device,
+        "compute_type": args.compute_type,
+        "beam_size": args.beam_size,
+        "language": args.language,
+        "whisperx_mode": args.whisperx_mode,
+        "whisperx_vad_method": args.whisperx_vad_method,
+        "whisperx_hf_token": (
+            hashlib.sha256(hf_token.encode("utf-8")).hexdigest()[:16] if hf_token else None
+        ),
+        "whisperx_min_speakers": args.whisperx_min_speakers,
+        "whisperx_max_speakers": args.whisperx_max_speakers,
+    }
+
+
+class _TranscriptionRequestHandler(socketserver.StreamRequestHandler):
+    """One JSON header line, optional raw int16 PCM payload, one JSON reply line."""
+
+    server: TranscriptionServer
+
+    def handle(self) -> None:
+        try:
+            header = json.loads(self.rfile.readline())
+            payload = self.rfile.read(int(header.get("nbytes", 0)))
+            reply = self.server.handle_request_payload(header, payload)
+        except Exception as exc:
+            reply = {"error": str(exc)}
+        try:
+            self.wfile.write((json.dumps(reply) + "\n").encode("utf-8"))
+            if "job" in reply:
+                # The stopper closes the connection once it has emitted the text.
+                self.rfile.read()
+        except OSError:
+            pass
+        finally:
+            if "job" in reply:
+                self.server.acknowledge(int(reply["job"]))
+
+
+class TranscriptionServer(socketserver.ThreadingUnixStreamServer):
+    """Unix-socket server that answers transcription requests from a resident model.
+
+    With a CaptureDaemon attached it also records: ``start`` begins a capture
+    (including pre-roll) and ``stop`` transcribes it and replies with the text.
+    Connections are handled on threads, but decoding runs on a single FIFO
+    queue, so a new capture can start while earlier ones are still decoding.
+    Capture replies carry a job ID from the same ``jobs.json`` counter as the
+    toggle workers, and the job's emission lock is held until its stopper
+    acknowledges emitting the text, so stoppers of both paths emit in order.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: Path,
+        resident: ResidentBackend,
+        config: dict[str, object],
+        args: argparse.Namespace,
+        capture: CaptureDaemon | None = None,
+    ) -> None:
+        import concurrent.futures
+
+        self.resident = resident
+        self.config = config
+        self.args = args
+        self.state_dir = Path(args.state_dir)
+        self.capture = capture
+        self.decoder = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="decode"
+        )
+        self.lock = threading.Lock()
+        self.emission_locks: dict[int, int | None] = {}
+        super().__init__(str(socket_path), _TranscriptionRequestHandler)
+
+    def acknowledge(self, job_id: int) -> None:
+        with self.lock:
+            if job_id not in self.emission_locks:
+                return
+            emission_lock = self.emission_locks.pop(job_id)
+        _finish_job(self.state_dir, job_id, emission_lock)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.decoder.shutdown(wait=False, cancel_futures=True)
+
+    def handle_request_payload(
+        self, header: dict[str, object], payload: bytes
+    ) -> dict[str, object]:
+        op = header.get("op")
+        if op == "ping":
+            return {
+                "ok": True,
+                "config": self.config,
+                "capture": self.capture is not None,
+                "recording": self.capture is not None and self.capture.recording,
+            }
+        if op not in ("transcribe", "start", "stop"):
+            return {"error": f"Unknown request: {op}"}
+        if header.get("config") != self.config:
+            return {"error": "Server holds a different model configuration.", "mismatch": True}
+        if op == "transcribe":
+            channels = int(header["channels"])
+            return self.decoder.submit(
+                self._transcribe,
+                np.frombuffer(payload, dtype=np.int16).reshape(-1, channels),
+                samplerate=int(header["samplerate"]),
+                channels=channels,
+                header=header,
+            ).result()
+
+        if self.capture is None:
+            return {"error": "Server was started without --capture.", "unsupported": True}
+        with self.lock:
+            if op == "start":
+                if self.capture.recording:
+                    return {"error": "Recording is already running."}
+                self.capture.start()
+                _append_log(self.state_dir, "server capture start")
+                return {"ok": True}
+
+            if not self.capture.recording:
+                return {"error": "No active recording.", "idle": True}
+            captured = self.capture.stop()
+            job_id, emission_lock = _claim_job(self.state_dir)
+            self.emission_locks[job_id] = emission_lock
+
+        try:
+            reply = self.decoder.submit(self._transcribe_capture, captured, header).result()
+        except BaseException:
+            self.acknowledge(job_id)
+            raise
+        return {**reply, "job": job_id}
+
+    def _transcribe_capture(
+        self, captured: np.ndarray, header: dict[str, object]
+    ) -> dict[str, object]:
+        audio, samplerate, channels = downmix_and_resample(
+            captured,
+            self.capture.samplerate,
+            self.capture.channels,
+            self.args.target_samplerate,
+        )
+        trimmed = trim_silence(
+            audio,
+            samplerate,
+            channels,
+            method=self.args.vad,
+            padding=self.args.vad_padding,
+            state_dir=self.state_dir,
+        )
+        reply = (
+            {"text": ""}
+            if trimmed is None
+            else self._transcribe(trimmed, samplerate=samplerate, channels=channels, header=header)
+        )
+        if "text" in reply:
+            _archive_in_background(
+                RecordingArchive.for_args(self.args),
+                self.args,
+                str(self.config["model"]),
+                captured,
+                self.capture.samplerate,
+                self.capture.channels,
+                str(reply["text"]),
+            )
+        return reply
+
+    def _transcribe(
+        self,
+        audio: np.ndarray,
+        samplerate: int,
+        channels: int,
+        header: dict[str, object],
+    ) -> dict[str, object]:
+        with _timed_stage("decode", audio_seconds=round(len(audio) / samplerate, 2)):
+            text = self.resident.transcribe(
+                audio,
+                samplerate=samplerate,
+                channels=channels,
+                task=str(header["task"]),
+                language=header.get("language") or None,
+            )
+        return {"text": text}
+
+
+def _server_request(
+    state_dir: Path,
+    header: dict[str, object],
+    payload: np.ndarray | None = None,
+    timeout: float | None = None,
+    hold: contextlib.ExitStack | None = None,
+) -> dict[str, object] | None:
+    """Send one request to a running ``--mode serve`` daemon; None when none listens.
+
+    With ``hold`` the connection stays open until that stack closes, which
+    the daemon takes as the caller's acknowledgement (see ``acknowledge``).
+    """
+    socket_path = state_dir / SERVER_SOCKET_NAME
+    if not socket_path.exists():
+        return None
+
+    header = {**header, "nbytes": 0 if payload is None else payload.nbytes}
+    try:
+        with contextlib.ExitStack() as stack:
+            conn = stack.enter_context(socket.socket(socket.AF_UNIX, socket.SOCK_STREAM))
+            conn.connect(str(socket_path))
+            conn.settimeout(timeout)
+            conn.sendall((json.dumps(header) + "\n").encode("utf-8"))
+            if payload is not None:
+                # Stop/ping requests carry no payload, so this path needs no numpy import.
+                contiguous = payload if payload.flags.c_contiguous else payload.copy()
+                conn.sendall(memoryview(contiguous).cast("B"))
+            with conn.makefile("rb") as reader:
+                line = reader.readline()
+            if hold is not None:
+                hold.enter_context(stack.pop_all())
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
+    if not line:
+        raise RuntimeError("Transcription server closed the connection without a reply.")
+    return json.loads(line)
+
+
+def _transcribe_via_server(
+    args: argparse.Namespace,
+    model_name_or_path: str,
+    audio: np.ndarray,
+    samplerate: int,
+    channels: int,
+) -> str | None:
+    """Submit audio to a running ``--mode serve`` daemon; None when none is usable."""
+    state_dir = Path(args.state_dir)
+    started = time.monotonic()
+    reply = _server_request(
+        state_dir,
+        {
+            "op": "transcribe",
+            "config": _server_config(args, model_name_or_path),
+            "samplerate": samplerate,
+            "channels": channels,
+            "task": args.task,
+            "language": args.language,
+        },
+        payload=audio,
+    )
+    if reply is None:
+        return None
+    _log_stage("server_request", time.monotonic() - started)
+    if reply.get("mismatch"):
+        _append_log(state_dir, "server config mismatch, falling back to CLI backend")
+        return None
+    if "error" in reply:
+        raise RuntimeError(f"Transcription server error: {reply['error']}")
+    return str(reply.get("text", ""))
+
+
+def _capture_request(
+    args: argparse.Namespace, op: str, hold: contextlib.ExitStack | None = None
+) -> dict[str, object] | None:
+    """Drive a ``--mode serve --capture`` daemon; None when recording must use a worker."""
+    state_dir = Path(args.state_dir)
+    if op == "ping":
+        try:
+            reply = _server_request(state_dir, {"op": "ping"}, timeout=1.0)
+        except TimeoutError:
+            _append_log(state_dir, "capture daemon did not answer ping, using a worker")
+            return None
+        return reply if reply and reply.get("capture") else None
+    reply = _server_request(
+        state_dir,
+        {
+            "op": op,
+            "config": _server_config(args, _resolve_model_argument(args.model)),
+            "task": args.task,
+            "language": args.language,
+        },
+        timeout=max(args.stop_timeout, 1.0) if op == "stop" else None,
+        hold=hold,
+    )
+    if reply is None or reply.get("mismatch") or reply.get("unsupported"):
+        return None
+    return reply
+
+
+def run_server(args: argparse.Namespace) -> int:
+    state_dir = Path(args.state_dir)
+    state_dir.mkdir(parents=True, exist_ok=True)
+    socket_path = state_dir / SERVER_SOCKET_NAME
+    if socket_path.exists():
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                probe.connect(str(socket_path))
+        except ConnectionRefusedError:
+            socket_path.unlink()
+        else:
+            print(f"Transcription server already running: {socket_path}", file=sys.stderr)
+            return 1
+
+    model_name_or_path = _resolve_model_argument(args.model)
+    with _timed_stage("model_load", backend=args.backend, model=model_name_or_path):
+        resident = load_resident_backend(args, model_name_or_path)
+
+    def _terminate(_signum, _frame) -> None:
+        raise SystemExit(0)
+
+    signal.signal(signal.SIGTERM, _terminate)
+    capture: CaptureDaemon | None = None
+    if args.capture:
+        capture = CaptureDaemon(
+            args.samplerate,
+            args.channels,
+            preroll_seconds=max(args.preroll, 0.0),
+            max_seconds=args.max_duration if args.max_duration > 0 else None,
+        )
+    server = TranscriptionServer(
+        socket_path,
+        resident,
+        _server_config(args, model_name_or_path),
+        args,
+        capture=capture,
+    )
+    print(f"Transcription server listening on {socket_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path.exists():
+            socket_path.unlink()
+        if capture is not None:
+            capture.close()
+        resident.close()
+        _append_log(state_dir, "server stopped")
+    return 0
+
+
+def _read_wav(path: Path) -> tuple[np.ndarray, int, int]:
+    with wave.open(str(path), "rb") as wav_file:
+        if wav_file.getsampwidth() != 2:
+            raise RuntimeError(f"{path}: only 16-bit PCM WAV files are supported.")
+        channels = wav_file.getnchannels()
+        samplerate = wav_file.getframerate()
+        frames = wav_file.readframes(wav_file.getnframes())
+    return np.frombuffer(frames, dtype=np.int16).reshape(-1, channels), samplerate, channels
+
+
+def _normalize_words(text: str) -> list[str]:
+    return re.findall(r"[\w']+", text.lower())
+
+
+def _word_errors(reference: str, hypothesis: str) -> tuple[int, int]:
+    """Return (word edit distance, reference word count) for WER aggregation."""
+    ref = _normalize_words(reference)
+    hyp = _normalize_words(hypothesis)
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, start=1):
+        current = [i]
+        for j, hyp_word in enumerate(hyp, start=1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (ref_word != hyp_word),
+                )
+            )
+        previous = current
+    return previous[-1], len(ref)
+
+
+BENCHMARK_DEVICES = ("auto", "cpu", "cuda")
+BENCHMARK_COMPUTE_TYPES = (
+    "auto",
+    "default",
+    "float16",
+    "float32",
+    "bfloat16",
+    "int8",
+    "int8_float16",
+    "int8_float32",
+    "int8_bfloat16",
+    "int16",
+)
+
+
+def _parse_benchmark_config(spec: str, args: argparse.Namespace) -> argparse.Namespace:
+    """Turn ``backend:model[:compute_type[:device]]`` into a per-run Namespace.
+
+    Model paths may contain ':', so the optional fields are peeled off the right
+    and only taken when they name a known compute type / device (or are empty).
+    """
+    backend, sep, rest = spec.partition(":")
+    if not sep or backend not in ("whispercpp", "ctranslate2", "whisperx"):
+        raise RuntimeError(
+            f"Invalid benchmark config {spec!r}; expected backend:model[:compute_type[:device]]."
+        )
+    parts = rest.rsplit(":", 2)
+    compute_type = device = ""
+    if len(parts) == 3 and parts[2] in BENCHMARK_DEVICES + ("",) and (
+        parts[1] in BENCHMARK_COMPUTE_TYPES + ("",)
+    ):
+        rest, compute_type, device = parts
+    elif len(parts) >= 2 and parts[-1] in BENCHMARK_COMPUTE_TYPES + ("",):
+        rest, compute_type = rest.rsplit(":", 1)
+    if not rest:
+        raise RuntimeError(f"Invalid benchmark config {spec!r}; the model is empty.")
+    run_args = argparse.Namespace(**vars(args))
+    run_args.backend = backend
+    run_args.model = rest
+    if compute_type:
+        run_args.compute_type = compute_type
+    if device:
+        run_args.device = device
+    return run_args
+
+
+def _benchmark_combination(
+    run_args: argparse.Namespace, spec: str, files: list[Path], use_resident: bool = True
+) -> dict[str, object]:
+    """Benchmark one configuration; runs in a fresh process so peak RSS is its own.
+
+    With ``use_resident`` False the CLI path a toggle worker takes is timed,
+    including its per-run model load.
+    """
+    row: dict[str, object] = {
+        "config": spec,
+        "backend": run_args.backend,
+        "model": run_args.model,
+        "compute_type": run_args.compute_type,
+        "device": run_args.device,
+    }
+    model_name_or_path = _resolve_model_argument(run_args.model)
+    notifier = _notifier(False)
+    resident: ResidentBackend | None = None
+    started = time.perf_counter()
+    if use_resident:
+        try:
+            resident = load_resident_backend(run_args, model_name_or_path)
+            row["load_s"] = round(time.perf_counter() - started, 3)
+            row["engine"] = "resident"
+        except RuntimeError as exc:
+            print(f"{spec}: resident backend unavailable, timing the CLI: {exc}", file=sys.stderr)
+    if resident is None:
+        # Without the Python package / whisper-server, model load is folded into
+        # every CLI decode and cannot be reported separately.
+        row["load_s"] = None
+        row["engine"] = "cli"
+
+    audio_seconds = 0.0
+    decode_seconds = 0.0
+    transcript_words = 0
+    edit_distance = 0
+    reference_words = 0
+    try:
+        for path in files:
+            audio, samplerate, channels = _read_wav(path)
+            audio_seconds += len(audio) / samplerate
+            started = time.perf_counter()
+            if resident is not None:
+                text = resident.transcribe(
+                    audio, samplerate, channels, run_args.task, run_args.language
+                )
+            else:
+                with _scratch_directory() as tmp_dir:
+                    clip = AudioClip(audio, samplerate, channels, Path(tmp_dir))
+                    text = transcribe(
+                        backend=run_args.backend,
+                        model_name_or_path=model_name_or_path,
+                        clip=clip,
+                        notifier=notifier,
+                        device=run_args.device,
+                        compute_type=run_args.compute_type,
+                        beam_size=run_args.beam_size,
+                        task=run_args.task,
+                        language=run_args.language,
+                        whisperx_mode=run_args.whisperx_mode,
+                        whisperx_vad_method=run_args.whisperx_vad_method,
+                        whisperx_hf_token=run_args.whisperx_hf_token,
+                        whisperx_min_speakers=run_args.whisperx_min_speakers,
+                        whisperx_max_speakers=run_args.whisperx_max_speakers,
+                        audio_transport=run_args.audio_transport,
+                        threads=run_args.threads,
+                    )
+            decode_seconds += time.perf_counter() - started
+            transcript_words += len(text.split())
+            reference = path.with_suffix(".txt")
+            if reference.exists():
+                errors, words = _word_errors(reference.read_text(encoding="utf-8"), text)
+                edit_distance += errors
+                reference_words += words
+    except Exception as exc:
+        row["error"] = str(exc)
+    finally:
+        if resident is not None:
+            resident.close()
+
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    row.update(
+        {
+            "files": len(files),
+            "audio_s": round(audio_seconds, 3),
+            "decode_s": round(decode_seconds, 3),
+            "rtf": round(decode_seconds / audio_seconds, 4) if audio_seconds else None,
+            "words": transcript_words,
+            "peak_rss_mb": round(max(own, children) / 1024, 1),
+            "wer": round(edit_distance / reference_words, 4) if reference_words else None,
+        }
+    )
+    return row
+
+
+BENCHMARK_COLUMNS = (
+    "config",
+    "backend",
+    "model",
+    "compute_type",
+    "device",
+    "engine",
+    "files",
+    "audio_s",
+    "load_s",
+    "decode_s",
+    "rtf",
+    "words",
+    "peak_rss_mb",
+    "wer",
+    "error",
+)
+
+
+def _benchmark_in_subprocess(
+    run_args: argparse.Namespace, spec: str, files: list[Path], use_resident: bool = True
+) -> dict[str, object]:
+    import concurrent.futures
+    import multiprocessing
+
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(
+            _benchmark_combination, run_args, spec, files, use_resident
+        ).result()
+
+
+def _print_benchmark_summary(rows: list[dict[str, object]]) -> None:
+    """Rank configurations by real-time factor, separately for each engine.
+
+    A CLI row's decode time includes a model load on every file while a resident
+    row's does not, so the two are never ranked against each other.
+    """
+    for engine in ("resident", "cli"):
+        ranked = sorted(
+            (row for row in rows if row.get("engine") == engine and row.get("rtf") is not None),
+            key=lambda row: float(row["rtf"]),
+        )
+        if not ranked:
+            continue
+        note = " (decode_s includes model load)" if engine == "cli" else ""
+        print(f"{engine} engine{note}:", file=sys.stderr)
+        for rank, row in enumerate(ranked, 1):
+            print(
+                f"  {rank}. {row['config']}  rtf={row['rtf']}  decode_s={row['decode_s']}",
+                file=sys.stderr,
+            )
+    engines = {row.get("engine") for row in rows}
+    if len(engines) > 1:
+        print(
+            "Warning: resident and CLI engines were both used; their decode_s are not comparable.",
+            file=sys.stderr,
+        )
+
+
+def run_benchmark(args: argparse.Namespace) -> int:
+    import csv
+
+    if not args.benchmark_dir:
+        print("--mode benchmark requires --benchmark-dir.", file=sys.stderr)
+        return 1
+    files = sorted(Path(args.benchmark_dir).expanduser().glob("*.wav"))
+    if not files:
+        print(f"No .wav files found in {args.benchmark_dir}", file=sys.stderr)
+        return 1
+
+    specs = args.benchmark_configs or [
+        f"{args.backend}:{args.model}:{args.compute_type}:{args.device}"
+    ]
+    rows: list[dict[str, object]] = []
+    for spec in specs:
+        run_args = _parse_benchmark_config(spec, args)
+        print(f"Benchmarking {spec} on {len(files)} file(s)...", file=sys.stderr)
+        row = _benchmark_in_subprocess(run_args, spec, files)
+        rows.append(row)
+        print(json.dumps(row), file=sys.stderr)
+    _print_benchmark_summary(rows)
+
+    output = Path(args.benchmark_output).expanduser() if args.benchmark_output else None
+    if output is not None and output.suffix == ".csv":
+        with output.open("w", encoding="utf-8", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=BENCHMARK_COLUMNS, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(rows)
+    elif output is not None:
+        output.write_text(json.dumps(rows, indent=2) + "\n", encoding="utf-8")
+    else:
+        print(json.dumps(rows, indent=2))
+    return 0 if all("error" not in row for row in rows) else 1
+
+
+PROFILE_NAME = "profile.json"
+PROFILE_DEFAULTS = {
+    "backend": "whispercpp",
+    "model": DEFAULT_MODEL,
+    "device": "auto",
+    "compute_type": "auto",
+    "threads": None,
+}
+
+
+def _probe_cpu() -> dict[str, object]:
+    """CPU SIMD features and core counts relevant to whisper.cpp/CTranslate2 speed."""
+    flags: set[str] = set()
+    physical: set[tuple[str, str]] = set()
+    physical_id = core_id = ""
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as fh:
+            for line in fh:
+                key, _, value = line.partition(":")
+                key = key.strip()
+                if key in ("flags", "Features") and not flags:
+                    flags = set(value.split())
+                elif key == "physical id":
+                    physical_id = value.strip()
+                elif key == "core id":
+                    core_id = value.strip()
+                    physical.add((physical_id, core_id))
+    except OSError:
+        pass
+    logical = len(os.sched_getaffinity(0))
+    wanted = ("avx", "avx2", "fma", "f16c", "avx512f", "avx512_vnni", "avx_vnni", "asimd", "neon")
+    return {
+        "logical_cpus": logical,
+        "physical_cores": min(len(physical), logical) if physical else logical,
+        "features": sorted(flag for flag in wanted if flag in flags),
+    }
+
+
+def _probe_cuda() -> list[str]:
+    nvidia_smi = shutil.which("nvidia-smi")
+    if not nvidia_smi:
+        return []
+    try:
+        result = subprocess.run(
+            [nvidia_smi, "--query-gpu=name,memory.total", "--format=csv,noheader"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except subprocess.TimeoutExpired:
+        return []
+    if result.returncode != 0:
+        return []
+    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+
+
+def _probe_backends() -> dict[str, bool]:
+    return {
+        "whispercpp": shutil.which("whisper-cli") is not None,
+        "ctranslate2": shutil.which("whisper-ctranslate2") is not None,
+        "whisperx": shutil.which("whisperx") is not None
+        or importlib.util.find_spec("whisperx") is not None,
+    }
+
+
+def _calibration_candidates(
+    args: argparse.Namespace,
+    backends: dict[str, bool],
+    cpu: dict[str, object],
+    gpus: list[str],
+) -> list[argparse.Namespace]:
+    # int8 kernels only pay off with wide integer SIMD; older CPUs stay on float32.
+    fast_int8 = bool({"avx2", "avx512f", "asimd", "neon"} & set(cpu["features"]))
+    thread_counts = sorted({int(cpu["physical_cores"]), int(cpu["logical_cpus"])})
+    candidates = []
+    for backend, installed in backends.items():
+        if not installed:
+            continue
+        devices = ["cpu"] + (["cuda"] if gpus else [])
+        for device in devices:
+            if backend == "whispercpp":
+                compute_type = "default"
+            elif device == "cuda":
+                compute_type = "float16"
+            else:
+                compute_type = "int8" if fast_int8 else "float32"
+            # GPU runs and whisperx (its own thread handling) need no thread sweep.
+            sweep = thread_counts if device == "cpu" and backend != "whisperx" else [None]
+            for threads in sweep:
+                run_args = argparse.Namespace(**vars(args))
+                run_args.backend = backend
+                run_args.model = args.model or DEFAULT_MODEL
+                run_args.device = device
+                run_args.compute_type = compute_type
+                run_args.threads = threads
+                candidates.append(run_args)
+    return candidates
+
+
+def _reference_clip(args: argparse.Namespace, directory: Path) -> Path | None:
+    """Speech to calibrate on: ``--calibrate-clip``, else the latest archived recording.
+
+    Synthetic audio is no substitute, since a candidate that transcribes it as
+    nothing (or as noise) would win on speed alone.
+    """
+    if args.calibrate_clip:
+        return Path(args.calibrate_clip).expanduser()
+    archive = RecordingArchive(Path(args.state_dir) / "archive", args.archive_format)
+    if not archive.index_path.exists():
+        return None
+    recordings = archive.recordings()
+    if not recordings:
+        return None
+    latest = recordings[-1]
+    audio = archive.load(latest)
+    path = directory / "calibration.wav"
+    write_wav(path, audio, int(latest["samplerate"]), audio.shape[1])
+    return path
+
+
+def run_calibrate(args: argparse.Namespace) -> int:
+    state_dir = Path(args.state_dir)
+    cpu = _probe_cpu()
+    gpus = _probe_cuda()
+    backends = _probe_backends()
+    print(
+        f"CPU: {cpu['logical_cpus']} threads, {cpu['physical_cores']} cores, "
+        f"features: {' '.join(cpu['features']) or 'none'}",
+        file=sys.stderr,
+    )
+    print(f"CUDA: {', '.join(gpus) or 'none'}", file=sys.stderr)
+    print(
+        f"Backends: {', '.join(name for name, ok in backends.items() if ok) or 'none'}",
+        file=sys.stderr,
+    )
+
+    candidates = _calibration_candidates(args, backends, cpu, gpus)
+    if not candidates:
+        print("No transcription backend found in PATH; nothing to calibrate.", file=sys.stderr)
+        return 1
+
+    rows: list[dict[str, object]] = []
+    with tempfile.TemporaryDirectory(prefix="whisper-calibrate-") as tmp_dir:
+        clip = _reference_clip(args, Path(tmp_dir))
+        if clip is None:
+            print(
+                "No speech to calibrate on; pass --calibrate-clip with a WAV recording "
+                "of speech, or record something with --archive first.",
+                file=sys.stderr,
+            )
+            return 1
+        for run_args in candidates:
+            spec = (
+                f"{run_args.backend}:{run_args.model}:{run_args.compute_type}:"
+                f"{run_args.device}:{run_args.threads or 'default'}"
+            )
+            print(f"Calibrating {spec}...", file=sys.stderr)
+            row = _benchmark_in_subprocess(run_args, spec, [clip], use_resident=False)
+            row["threads"] = run_args.threads
+            rows.append(row)
+            print(json.dumps(row), file=sys.stderr)
+
+    # A configuration that hears nothing in the clip is broken, however fast it is.
+    viable = [
+        row
+        for row in rows
+        if "error" not in row and row.get("rtf") is not None and row.get("words")
+    ]
+    if not viable:
+        print(
+            "No candidate configuration produced a transcript; profile not written.",
+            file=sys.stderr,
+        )
+        return 1
+    best = min(viable, key=lambda row: float(row["rtf"]))
+    profile = {
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "cpu": cpu,
+        "cuda": gpus,
+        "backends": backends,
+        "results": rows,
+        "choice": {key: best[key] for key in PROFILE_DEFAULTS},
+    }
+    state_dir.mkdir(parents=True, exist_ok=True)
+    (state_dir / PROFILE_NAME).write_text(json.dumps(profile, indent=2) + "\n", encoding="utf-8")
+    print(json.dumps(profile["choice"]))
+    print(f"Saved {state_dir / PROFILE_NAME}", file=sys.stderr)
+    return 0
+
+
+def _apply_profile(args: argparse.Namespace, check_installed: bool = True) -> None:
+    """Fill options left unset on the command line from ``--mode calibrate``'s choice.
+
+    The profile only applies when ``--backend`` is omitted or names the
+    calibrated backend, and while that backend is still installed, since
+    models and compute types are backend-specific.  ``check_installed`` is off
+    for the light start/stop/toggle/status commands; the options they fill in
+    are listed in ``args.profile_filled`` so ``start`` leaves them for the
+    worker to resolve (and check) itself.
+    """
+    choice: dict[str, object] = {}
+    try:
+        profile = json.loads((Path(args.state_dir) / PROFILE_NAME).read_text(encoding="utf-8"))
+        choice = dict(profile.get("choice") or {})
+    except (OSError, ValueError):
+        pass
+    if args.backend is not None and args.backend != choice.get("backend"):
+        choice = {}
+    if check_installed and choice and not _probe_backends().get(str(choice.get("backend"))):
+        # The calibrated backend was uninstalled since; its model and compute
+        # type would not suit whatever runs instead.
+        choice = {}
+    args.profile_filled = [key for key in PROFILE_DEFAULTS if getattr(args, key) is None]
+    for key in args.profile_filled:
+        setattr(args, key, choice.get(key, PROFILE_DEFAULTS[key]))
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    """Linearly interpolated percentile of an already sorted, non-empty list."""
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    weight = position - lower
+    return sorted_values[lower] * (1.0 - weight) + sorted_values[upper] * weight
+
+
+def _read_stage_records(log_file: Path, since: float | None = None) -> list[dict[str, object]]:
+    records: list[dict[str, object]] = []
+    if not log_file.exists():
+        return records
+    with log_file.open(encoding="utf-8", errors="replace") as fh:
+        for line in fh:
+            _, sep, payload = line.partition("] {")
+            if not sep:
+                continue
+            try:
+                record = json.loads("{" + payload)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(record, dict) or record.get("event") != "stage":
+                continue
+            if since is not None and float(record.get("ts", 0.0)) < since:
+                continue
+            records.append(record)
+    return records
+
+
+def run_stats(args: argparse.Namespace) -> int:
+    log_file = Path(args.state_dir) / "worker.log"
+    since = time.time() - args.stats_since * 3600.0 if args.stats_since > 0 else None
+    records = _read_stage_records(log_file, since=since)
+    if not records:
+        print(f"No stage timings found in {log_file}", file=sys.stderr)
+        return 1
+
+    durations: dict[str, list[float]] = {}
+    for record in records:
+        if record.get("failed"):
+            continue
+        durations.setdefault(str(record["stage"]), []).append(float(record["ms"]))
+
+    print(f"{'stage':<18} {'count':>6} {'p50 ms':>10} {'p95 ms':>10} {'mean ms':>10} {'max ms':>10}")
+    for stage, values in sorted(durations.items()):
+        values.sort()
+        print(
+            f"{stage:<18} {len(values):>6} {_percentile(values, 0.5):>10.1f} "
+            f"{_percentile(values, 0.95):>10.1f} {sum(values) / len(values):>10.1f} "
+            f"{values[-1]:>10.1f}"
+        )
+    return 0
+
+
+def run_retranscribe(args: argparse.Namespace) -> int:
+    import concurrent.futures
+
+    archive = RecordingArchive(Path(args.state_dir) / "archive", args.archive_format)
+    if not archive.index_path.exists():
+        print(f"No recording archive in {archive.directory} (record with --archive).", file=sys.stderr)
+        return 1
+
+    model_name_or_path = _resolve_model_argument(args.model)
+    done = archive.transcribed_ids(args.backend, model_name_or_path)
+    rows = [row for row in archive.recordings() if row["id"] not in done]
+    if not rows:
+        print("Every archived recording already has a transcript for this backend/model.", file=sys.stderr)
+        return 0
+
+    workers = max(min(args.retranscribe_jobs, len(rows)), 1)
+    threads = max(len(os.sched_getaffinity(0)) // workers, 1)
+    cache = TranscriptCache.for_args(args)
+    quiet = _notifier(False)
+    print(
+        f"Re-transcribing {len(rows)} recording(s) with {args.backend}:{model_name_or_path} "
+        f"using {workers} worker(s)...",
+        file=sys.stderr,
+    )
+
+    def _retranscribe(row: sqlite3.Row) -> str:
+        audio = archive.load(row)
+        samplerate, channels = int(row["samplerate"]), audio.shape[1]
+        trimmed = trim_silence(
+            audio,
+            samplerate,
+            channels,
+            method=args.vad,
+            padding=args.vad_padding,
+            state_dir=Path(args.state_dir),
+        )
+        if trimmed is None:
+            return ""
+        with _scratch_directory() as tmp_dir:
+            clip = AudioClip(trimmed, samplerate, channels, Path(tmp_dir))
+            return transcribe(
+                backend=args.backend,
+                model_name_or_path=model_name_or_path,
+                clip=clip,
+                notifier=quiet,
+                device=args.device,
+                compute_type=args.compute_type,
+                beam_size=args.beam_size,
+                task=args.task,
+                language=args.language,
+                whisperx_mode=args.whisperx_mode,
+                whisperx_vad_method=args.whisperx_vad_method,
+                whisperx_hf_token=args.whisperx_hf_token,
+                whisperx_min_speakers=args.whisperx_min_speakers,
+                whisperx_max_speakers=args.whisperx_max_speakers,
+                audio_transport=args.audio_transport,
+                cache=cache,
+                threads=threads,
+            ).strip()
+
+    status = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_retranscribe, row): row for row in rows}
+        for future in concurrent.futures.as_completed(futures):
+            row = futures[future]
+            try:
+                text = future.result()
+            except Exception as exc:
+                print(json.dumps({"id": row["id"], "error": str(exc)}), file=sys.stderr)
+                status = 1
+                continue
+            archive.add_transcript(row["id"], args.backend, model_name_or_path, text)
+            print(
+                json.dumps(
+                    {
+                        "id": row["id"],
+                        "created": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(row["created"])),
+                        "previous": row["transcript"],
+                        "text": text,
+                    }
+                )
+            )
+    return status
+
+
+# Linux input event codes used to press the paste shortcut through ydotool.
+_YDOTOOL_KEYCODES = {
+    "ctrl": 29,
+    "shift": 42,
+    "alt": 56,
+    "super": 125,
+    "insert": 110,
+    **{letter: code for letter, code in zip("qwertyuiop", range(16, 26))},
+    **{letter: code for letter, code in zip("asdfghjkl", range(30, 39))},
+    **{letter: code for letter, code in zip("zxcvbnm", range(44, 51))},
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _typing_tool() -> str:
+    for tool in ("wtype", "ydotool", "xdotool"):
+        if shutil.which(tool):
+            return tool
     raise RuntimeError("No typing tool found. Install one of: wtype, ydotool, xdotool.")
 
 
+@functools.lru_cache(maxsize=None)
+def _clipboard_tools() -> tuple[list[str], list[str], list[str], list[str]] | None:
+    """Return (copy, paste, list types, clear) commands for the session's clipboard."""
+    if os.environ.get("WAYLAND_DISPLAY") and shutil.which("wl-copy") and shutil.which("wl-paste"):
+        return (
+            ["wl-copy"],
+            ["wl-paste", "--no-newline"],
+            ["wl-paste", "--list-types"],
+            ["wl-copy", "--clear"],
+        )
+    if shutil.which("xclip"):
+        return (
+            ["xclip", "-selection", "clipboard", "-i"],
+            ["xclip", "-selection", "clipboard", "-o"],
+            ["xclip", "-selection", "clipboard", "-o", "-t", "TARGETS"],
+            ["xclip", "-selection", "clipboard", "-i", "/dev/null"],
+        )
+    return None
+
+
+# Clipboard targets that a plain-text round trip through paste/copy preserves.
+_PLAIN_TEXT_TARGETS = {"UTF8_STRING", "STRING", "TEXT", "COMPOUND_TEXT"}
+_CLIPBOARD_META_TARGETS = {"TARGETS", "TIMESTAMP", "MULTIPLE", "SAVE_TARGETS"}
+
+
+def _is_plain_text_clipboard(types: list[str]) -> bool:
+    for target in types:
+        if target in _PLAIN_TEXT_TARGETS or target in _CLIPBOARD_META_TARGETS:
+            continue
+        if target == "text/plain" or target.startswith("text/plain;"):
+            continue
+        return False
+    return True
+
+
+def _type_with_tool(text: str, delay_ms: int | None = None) -> None:
+    """Type ``text``; without ``delay_ms`` each tool keeps its own keystroke timing."""
+    tool = _typing_tool()
+    if tool == "wtype":
+        delay = ["-d", str(delay_ms)] if delay_ms is not None else []
+        subprocess.run(["wtype", *delay, "--", text], check=True)
+    elif tool == "ydotool":
+        delay = (
+            ["--key-delay", str(delay_ms), "--key-hold", str(delay_ms)]
+            if delay_ms is not None
+            else []
+        )
+        subprocess.run(["ydotool", "type", *delay, "--", text], check=True)
+    else:
+        delay = ["--delay", str(delay_ms)] if delay_ms is not None else []
+        subprocess.run(
+            ["xdotool", "type", "--clearmodifiers", *delay, "--", text],
+            check=True,
+        )
+
+
+def _press_keys(combo: str) -> None:
+    keys = [key.strip().lower() for key in combo.split("+") if key.strip()]
+    tool = _typing_tool()
+    if tool == "wtype":
+        *modifiers, key = keys
+        cmd = ["wtype"]
+        for modifier in modifiers:
+            cmd.extend(["-M", modifier])
+        cmd.extend(["-k", key])
+        for modifier in reversed(modifiers):
+            cmd.extend(["-m", modifier])
+        subprocess.run(cmd, check=True)
+    elif tool == "ydotool":
+        try:
+            codes = [_YDOTOOL_KEYCODES[key] for key in keys]
+        except KeyError as exc:
+            raise RuntimeError(f"Unsupported key for ydotool paste: {exc}") from exc
+        events = [f"{code}:1" for code in codes] + [f"{code}:0" for code in reversed(codes)]
+        subprocess.run(["ydotool", "key", *events], check=True)
+    else:
+        subprocess.run(["xdotool", "key", "--clearmodifiers", "+".join(keys)], check=True)
+
+
+def _paste_with_clipboard(text: str, paste_keys: str) -> bool:
+    """Paste the whole text in one keystroke, then restore the previous clipboard.
+
+    Returns False without touching the clipboard when it holds something other
+    than plain text (an image, rich text, files), which a text round trip would
+    lose; the caller types instead.  An empty clipboard is cleared again.
+    """
+    tools = _clipboard_tools()
+    if tools is None:
+        raise RuntimeError("No clipboard tool found. Install wl-clipboard or xclip.")
+    copy_cmd, paste_cmd, types_cmd, clear_cmd = tools
+    types = subprocess.run(types_cmd, capture_output=True, text=True)
+    offered = types.stdout.split() if types.returncode == 0 else []
+    if not _is_plain_text_clipboard(offered):
+        return False
+    previous = subprocess.run(paste_cmd, capture_output=True) if offered else None
+    encoded = text.encode("utf-8")
+    subprocess.run(copy_cmd, input=encoded, check=True)
+    try:
+        _press_keys(paste_keys)
+        # Give the focused application time to request the clipboard contents.
+        time.sleep(0.3)
+    finally:
+        # Leave the clipboard alone if something (e.g. a refined transcript) replaced it.
+        current = subprocess.run(paste_cmd, capture_output=True)
+        if current.stdout == encoded:
+            if previous is not None and previous.returncode == 0 and previous.stdout:
+                subprocess.run(copy_cmd, input=previous.stdout, check=False)
+            else:
+                subprocess.run(clear_cmd, stdin=subprocess.DEVNULL, check=False)
+    return True
+
+
 def _normalize_text_for_typing(text: str) -> str:
     # Prevent simulated Enter key presses from transcript line breaks.
     return " ".join(text.split())
 
 
-def _emit_text(text: str, args: argparse.Namespace, notifier: Notifier) -> int:
-    if args.output == "print":
-        print(text)
-        notifier.send("Done", "Transcription printed to terminal", timeout_ms=1500)
-        return 0
+def _emit_text(text: str, args: argparse.Namespace, notifier: Notifier) -> int:
+    if args.output == "print":
+        print(text)
+        notifier.send("Done", "Transcription printed to terminal", timeout_ms=1500)
+        return 0
+
+    text = _normalize_text_for_typing(text)
+    use_paste = args.type_method == "paste" or (
+        args.type_method == "auto"
+        and len(text) >= args.paste_threshold
+        and _clipboard_tools() is not None
+    )
+    try:
+        with _timed_stage(
+            "typing", method="paste" if use_paste else "type", chars=len(text)
+        ):
+            if not (use_paste and _paste_with_clipboard(text, args.paste_keys)):
+                _type_with_tool(text, delay_ms=args.type_delay)
+    except Exception as exc:
+        print(f"Failed to simulate typing: {exc}", file=sys.stderr)
+        notifier.send("Typing error", str(exc), timeout_ms=2500)
+        return 1
+
+    notifier.send("Done", "Transcription typed into active window", timeout_ms=1500)
+    return 0
+
+
+def _read_pid(pid_file: Path) -> int | None:
+    if not pid_file.exists():
+        return None
+    try:
+        return int(pid_file.read_text(encoding="utf-8").strip())
+    except ValueError:
+        return None
+
+
+def _is_alive(pid: int | None) -> bool:
+    if pid is None:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _claim_job(state_dir: Path, hold_emission: bool = True) -> tuple[int, int | None]:
+    """Assign the next job ID, returned with a held emission lock fd.
+
+    IDs come from ``jobs.json`` under ``flock`` so concurrent starts cannot
+    collide.  The job's ``jobs/<id>.lock`` is locked inside the same critical
+    section, so the next job's stopper always finds it held until
+    ``_finish_job`` (or process exit) releases it.  Toggle workers and the
+    capture daemon both claim IDs here, so their jobs share one order.
+    """
+    state_dir.mkdir(parents=True, exist_ok=True)
+    fd = os.open(state_dir / "jobs.json", os.O_RDWR | os.O_CREAT, 0o600)
+    with os.fdopen(fd, "r+", encoding="utf-8") as fh:
+        fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            job_id = int(json.loads(fh.read() or "{}").get("job", 0)) + 1
+        except (ValueError, AttributeError):
+            job_id = 1
+        fh.seek(0)
+        fh.truncate()
+        json.dump({"job": job_id}, fh)
+        fh.flush()
+        lock_fd = None
+        if hold_emission:
+            (state_dir / "jobs").mkdir(exist_ok=True)
+            lock_fd = os.open(state_dir / "jobs" / f"{job_id}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+    return job_id, lock_fd
+
+
+def _wait_for_job(state_dir: Path, job_id: int, timeout: float) -> bool:
+    """Block until job ``job_id`` has emitted its text (or its process is gone)."""
+    path = state_dir / "jobs" / f"{job_id}.lock"
+    try:
+        fd = os.open(path, os.O_RDWR)
+    except FileNotFoundError:
+        return True
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(0.02)
+    finally:
+        os.close(fd)
+
+
+def _finish_job(state_dir: Path, job_id: int, lock_fd: int | None) -> None:
+    if lock_fd is None:
+        return
+    (state_dir / "jobs" / f"{job_id}.lock").unlink(missing_ok=True)
+    os.close(lock_fd)
+
+
+def _release_pid_file(pid_file: Path) -> None:
+    # A newer worker may already own the file once this one released its slot.
+    if _read_pid(pid_file) == os.getpid():
+        pid_file.unlink(missing_ok=True)
+
+
+class ControlChannel:
+    """Unix socket a toggler uses to stop the worker and block until its result.
+
+    A client sends ``stop`` and keeps the connection open; the worker answers
+    with one JSON line (``{"text": ...}`` or ``{"error": ...}``) as soon as the
+    transcript is published.  Clients that connect after publication get the
+    result immediately.  The client closing the connection acknowledges that
+    the text was emitted, which is what ``delivered`` waits for.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        if path.exists():
+            path.unlink()
+        self.stop_requested = threading.Event()
+        self.published = threading.Event()
+        self.delivered = threading.Event()
+        self.clients = 0
+        self.condition = threading.Condition()
+        self.result: dict[str, object] = {}
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.listener.bind(str(path))
+        self.inode = path.stat().st_ino
+        self.listener.listen(4)
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def _accept_loop(self) -> None:
+        while True:
+            try:
+                conn, _addr = self.listener.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn: socket.socket) -> None:
+        with self.condition:
+            self.clients += 1
+        try:
+            with conn, conn.makefile("rwb") as stream:
+                request = stream.readline().decode("utf-8", errors="replace").strip()
+                if request == "stop":
+                    self.stop_requested.set()
+                self.published.wait()
+                stream.write((json.dumps(self.result) + "\n").encode("utf-8"))
+                stream.flush()
+                stream.read()
+                self.delivered.set()
+        except OSError:
+            # The client left before the result went out (e.g. its stop timed
+            # out); closing the stream can still fail flushing into the pipe.
+            pass
+        finally:
+            with self.condition:
+                self.clients -= 1
+                self.condition.notify_all()
+
+    def wait_delivered(self, timeout: float) -> bool:
+        """Wait for a client to acknowledge the result.
+
+        Gives up early once a stop was requested and no client is connected
+        any more, i.e. the stopper timed out and left.
+        """
+        with self.condition:
+            self.condition.wait_for(
+                lambda: self.delivered.is_set()
+                or (self.stop_requested.is_set() and not self.clients),
+                timeout,
+            )
+        return self.delivered.is_set()
 
-    try:
-        _type_with_tool(_normalize_text_for_typing(text))
-    except Exception as exc:
-        print(f"Failed to simulate typing: {exc}", file=sys.stderr)
-        notifier.send("Typing error", str(exc), timeout_ms=2500)
-        return 1
+    def publish(self, result: dict[str, object]) -> None:
+        self.result = result
+        self.published.set()
 
-    notifier.send("Done", "Transcription typed into active window", timeout_ms=1500)
-    return 0
+    def release(self) -> None:
+        """Stop accepting new clients so the next worker can bind the path.
 
+        Clients already connected keep their connection and still get the result.
+        """
+        self.listener.close()
+        try:
+            if self.path.stat().st_ino == self.inode:
+                self.path.unlink()
+        except FileNotFoundError:
+            pass
 
-def _read_pid(pid_file: Path) -> int | None:
-    if not pid_file.exists():
-        return None
-    try:
-        return int(pid_file.read_text(encoding="utf-8").strip())
-    except ValueError:
-        return None
+    def close(self) -> None:
+        self.release()
 
 
-def _is_alive(pid: int | None) -> bool:
-    if pid is None:
-        return False
-    try:
-        os.kill(pid, 0)
-    except ProcessLookupError:
-        return False
-    except PermissionError:
-        return True
-    return True
+def _request_stop(
+    socket_path: Path, timeout: float, hold: contextlib.ExitStack | None = None
+) -> dict[str, object] | None:
+    """Ask the worker to stop and wait for its result; None when no worker listens.
+
+    With ``hold`` the connection stays open until that stack closes, so the
+    worker (and the job queued behind it) waits until the text was emitted.
+    """
+    with contextlib.ExitStack() as stack:
+        conn = stack.enter_context(socket.socket(socket.AF_UNIX, socket.SOCK_STREAM))
+        try:
+            conn.connect(str(socket_path))
+        except (FileNotFoundError, ConnectionRefusedError):
+            return None
+        conn.settimeout(timeout)
+        conn.sendall(b"stop\n")
+        with conn.makefile("rb") as reader:
+            line = reader.readline()
+        if hold is not None:
+            hold.enter_context(stack.pop_all())
+    if not line:
+        return {"error": "Worker exited without publishing a transcript."}
+    return json.loads(line)
 
 
-def _read_and_clear_error(error_file: Path) -> str | None:
-    if not error_file.exists():
-        return None
-    message = error_file.read_text(encoding="utf-8").strip()
-    error_file.unlink()
-    return message or "Worker failed."
+def _wait_for_ready(read_fd: int, timeout: float) -> str | None:
+    """Block until the worker reports on its ready pipe; None on timeout."""
+    deadline = time.monotonic() + timeout
+    chunks: list[bytes] = []
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            readable, _, _ = select.select([read_fd], [], [], remaining)
+            if not readable:
+                return None
+            chunk = os.read(read_fd, 4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if b"\n" in chunk:
+                break
+    finally:
+        os.close(read_fd)
+    return b"".join(chunks).decode("utf-8", errors="replace").strip()
 
 
-def _run_transcription_job(args: argparse.Namespace, duration: float | None) -> str:
-    notifier = Notifier()
-    model_name_or_path = args.model
+def _resolve_model_argument(model_name_or_path: str) -> str:
     if (
         "/" in model_name_or_path
         or model_name_or_path.startswith(".")
@@ -506,28 +3337,64 @@ def _run_transcription_job(args: argparse.Namespace, duration: float | None) ->
         model_path = Path(model_name_or_path).expanduser()
         if not model_path.exists():
             raise RuntimeError(f"Model path not found: {model_path}")
-        model_name_or_path = str(model_path)
+        return str(model_path)
+    return model_name_or_path
 
-    notifier.send("Recording", "Starting...", timeout_ms=1200)
-    recorder = Recorder(samplerate=args.samplerate, channels=args.channels)
 
-    try:
-        audio = recorder.record(
-            duration=duration,
-            notifier=notifier,
-            interval=max(args.notify_interval, 0.2),
+def _transcribe_audio(
+    args: argparse.Namespace,
+    model_name_or_path: str,
+    audio: np.ndarray,
+    notifier: Notifier,
+) -> str:
+    with _timed_stage("resample", source_rate=args.samplerate, channels=args.channels):
+        audio, samplerate, channels = downmix_and_resample(
+            audio, args.samplerate, args.channels, args.target_samplerate
+        )
+    with _timed_stage("vad", method=args.vad):
+        trimmed = trim_silence(
+            audio,
+            samplerate,
+            channels,
+            method=args.vad,
+            padding=args.vad_padding,
+            state_dir=Path(args.state_dir),
+        )
+    if trimmed is None:
+        return ""
+    audio = trimmed
+    cache = TranscriptCache.for_args(args)
+
+    server_key: str | None = None
+    if cache is not None and (Path(args.state_dir) / SERVER_SOCKET_NAME).exists():
+        server_key = TranscriptCache.key(
+            AudioClip(audio, samplerate, channels, Path(args.state_dir)),
+            {
+                "server": _server_config(args, model_name_or_path),
+                "task": args.task,
+                "language": args.language,
+            },
+        )
+        cached = cache.get(server_key)
+        if cached is not None:
+            return cached.strip()
+    text = _transcribe_via_server(args, model_name_or_path, audio, samplerate, channels)
+    if text is not None:
+        if cache is not None and server_key is not None:
+            cache.put(server_key, text)
+        return text.strip()
+
+    if (
+        args.parallel_chunks > 1
+        and args.backend in ("whispercpp", "ctranslate2")
+        and len(audio) >= args.chunk_threshold * samplerate
+    ):
+        return _transcribe_chunked(
+            args, model_name_or_path, audio, samplerate, channels, notifier, cache
         )
-    except KeyboardInterrupt:
-        if not recorder.frames:
-            notifier.send("Recording", "Cancelled", timeout_ms=1000)
-            return ""
-        audio = np.concatenate(recorder.frames, axis=0)
-    except Exception as exc:
-        raise RuntimeError(f"Recording failed: {exc}") from exc
 
-    with tempfile.TemporaryDirectory(prefix="whisper-audio-") as tmp_dir:
-        wav_path = Path(tmp_dir) / "input.wav"
-        write_wav(wav_path, audio, args.samplerate, args.channels)
+    with _scratch_directory() as tmp_dir:
+        clip = AudioClip(audio, samplerate, channels, Path(tmp_dir))
         notifier.send(
             "Transcribing",
             f"Running backend: {args.backend}",
@@ -536,7 +3403,7 @@ def _run_transcription_job(args: argparse.Namespace, duration: float | None) ->
         text = transcribe(
             backend=args.backend,
             model_name_or_path=model_name_or_path,
-            wav_path=wav_path,
+            clip=clip,
             notifier=notifier,
             device=args.device,
             compute_type=args.compute_type,
@@ -548,61 +3415,290 @@ def _run_transcription_job(args: argparse.Namespace, duration: float | None) ->
             whisperx_hf_token=args.whisperx_hf_token,
             whisperx_min_speakers=args.whisperx_min_speakers,
             whisperx_max_speakers=args.whisperx_max_speakers,
+            audio_transport=args.audio_transport,
+            cache=cache,
+            threads=args.threads,
         )
 
     return text.strip()
 
 
+def _transcribe_chunked(
+    args: argparse.Namespace,
+    model_name_or_path: str,
+    audio: np.ndarray,
+    samplerate: int,
+    channels: int,
+    notifier: Notifier,
+    cache: TranscriptCache | None,
+) -> str:
+    """Decode a long capture as silence-bounded chunks across parallel backend processes."""
+    import concurrent.futures
+
+    spans = _split_at_silence(audio, samplerate, args.chunk_seconds, args.chunk_overlap)
+    workers = min(args.parallel_chunks, len(spans))
+    threads = max(len(os.sched_getaffinity(0)) // workers, 1)
+    quiet = _notifier(False)
+    done = 0
+    notifier.send(
+        "Transcribing",
+        f"Decoding {len(spans)} chunks with {workers} {args.backend} processes",
+        timeout_ms=1500,
+    )
+
+    def _decode(span: tuple[int, int]) -> str:
+        with _scratch_directory() as tmp_dir:
+            clip = AudioClip(
+                audio[span[0] : span[1]], samplerate, channels, Path(tmp_dir)
+            )
+            return transcribe(
+                backend=args.backend,
+                model_name_or_path=model_name_or_path,
+                clip=clip,
+                notifier=quiet,
+                device=args.device,
+                compute_type=args.compute_type,
+                beam_size=args.beam_size,
+                task=args.task,
+                language=args.language,
+                whisperx_mode=args.whisperx_mode,
+                whisperx_vad_method=args.whisperx_vad_method,
+                whisperx_hf_token=args.whisperx_hf_token,
+                whisperx_min_speakers=args.whisperx_min_speakers,
+                whisperx_max_speakers=args.whisperx_max_speakers,
+                audio_transport=args.audio_transport,
+                cache=cache,
+                threads=threads,
+            )
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_decode, span) for span in spans]
+        for _future in concurrent.futures.as_completed(futures):
+            done += 1
+            notifier.send(
+                "Transcribing", f"Decoded chunk {done}/{len(spans)}", timeout_ms=1500
+            )
+        texts = [future.result() for future in futures]
+    return _merge_chunk_texts(texts)
+
+
+def _run_transcription_job(
+    args: argparse.Namespace,
+    duration: float | None,
+    stop_event: threading.Event | None = None,
+    on_started: Callable[[], None] | None = None,
+    on_captured: Callable[[], None] | None = None,
+) -> str:
+    notifier = _notifier()
+    model_name_or_path = _resolve_model_argument(args.draft_model or args.model)
+
+    notifier.send("Recording", "Starting...", timeout_ms=1200)
+    recorder = Recorder(
+        samplerate=args.samplerate,
+        channels=args.channels,
+        max_seconds=args.max_duration if args.max_duration > 0 else None,
+    )
+    streamer: StreamingTranscriber | None = None
+    if args.stream:
+        # Segment decodes run during recording, so keep their notifications quiet.
+        segment_notifier = _notifier(False)
+        streamer = StreamingTranscriber(
+            lambda segment: _transcribe_audio(
+                args, model_name_or_path, segment, segment_notifier
+            ),
+            samplerate=args.samplerate,
+            chunk_seconds=max(args.stream_chunk, 2.0),
+        )
+
+    try:
+        audio = recorder.record(
+            duration=duration,
+            notifier=notifier,
+            interval=max(args.notify_interval, 0.2),
+            streamer=streamer,
+            stop_event=stop_event,
+            on_started=on_started,
+        )
+    except KeyboardInterrupt:
+        if not len(recorder.buffer):
+            notifier.send("Recording", "Cancelled", timeout_ms=1000)
+            if streamer is not None:
+                streamer.cancel()
+            return ""
+        audio = None
+    except Exception as exc:
+        if streamer is not None:
+            streamer.cancel()
+        raise RuntimeError(f"Recording failed: {exc}") from exc
+
+    if on_captured is not None:
+        on_captured()
+
+    # Time from end of recording to transcript: the latency felt after the keypress.
+    with _timed_stage("transcribe", streamed=streamer is not None):
+        if streamer is not None:
+            notifier.send(
+                "Transcribing",
+                f"Decoding final segment ({streamer.segments} already done)",
+                timeout_ms=1500,
+            )
+            text = streamer.finish(recorder.buffer).strip()
+        else:
+            if audio is None:
+                audio = recorder.buffer.view()
+            text = _transcribe_audio(args, model_name_or_path, audio, notifier)
+
+    archive = RecordingArchive.for_args(args)
+    if args.draft_model and text:
+        _refine_in_background(args, recorder.buffer.view(), text, archive)
+    else:
+        _archive_in_background(
+            archive,
+            args,
+            model_name_or_path,
+            recorder.buffer.view(),
+            args.samplerate,
+            args.channels,
+            text,
+        )
+    return text
+
+
+def _refine_in_background(
+    args: argparse.Namespace,
+    audio: np.ndarray,
+    draft: str,
+    archive: RecordingArchive | None,
+) -> None:
+    """Re-decode a ``--draft-model`` transcript with ``--model`` after it was emitted.
+
+    A refined text that differs from the draft replaces the clipboard and is
+    shown in a notification.  The thread is non-daemon, so a worker keeps
+    running until the refinement is delivered.
+    """
+
+    def _refine() -> None:
+        state_dir = Path(args.state_dir)
+        model_name_or_path = _resolve_model_argument(args.model)
+        try:
+            with _timed_stage("refine", model=model_name_or_path):
+                refined = _transcribe_audio(
+                    args, model_name_or_path, audio, _notifier(False)
+                )
+        except Exception as exc:
+            _append_log(state_dir, f"refinement failed: {exc}")
+            return
+        if archive is not None:
+            _archive_recording(
+                archive, args, model_name_or_path, audio, args.samplerate, args.channels, refined
+            )
+        if not refined or refined.split() == draft.split():
+            _append_log(state_dir, "refinement matches draft")
+            return
+
+        _append_log(state_dir, f"refined transcript_chars={len(refined)}")
+        tools = _clipboard_tools()
+        notifier = _notifier()
+        if tools is None:
+            notifier.send("Refined transcript", refined, timeout_ms=8000)
+            return
+        subprocess.run(tools[0], input=refined.encode("utf-8"), check=False)
+        notifier.send("Refined transcript (copied to clipboard)", refined, timeout_ms=8000)
+
+    threading.Thread(target=_refine, name="refine").start()
+
+
 def run_once(args: argparse.Namespace) -> int:
     duration = None if args.duration <= 0 else args.duration
     try:
         text = _run_transcription_job(args, duration=duration)
     except Exception as exc:
         print(str(exc), file=sys.stderr)
-        Notifier().send("Transcription error", str(exc), timeout_ms=3000)
+        _notifier().send("Transcription error", str(exc), timeout_ms=3000)
         return 1
 
     if not text:
         print("(No speech detected)")
-        Notifier().send("Done", "No speech detected", timeout_ms=1500)
+        _notifier().send("Done", "No speech detected", timeout_ms=1500)
         return 0
 
-    return _emit_text(text, args, Notifier())
+    return _emit_text(text, args, _notifier())
 
 
 def run_worker(args: argparse.Namespace) -> int:
     state_dir = Path(args.state_dir)
     state_dir.mkdir(parents=True, exist_ok=True)
     pid_file = state_dir / "recording.pid"
-    transcript_file = state_dir / "transcript.txt"
-    error_file = state_dir / "error.txt"
+    ready_fd: int | None = args.ready_fd
+
+    def _report_ready(message: str) -> None:
+        nonlocal ready_fd
+        if ready_fd is None:
+            return
+        try:
+            os.write(ready_fd, (message + "\n").encode("utf-8"))
+        except OSError:
+            pass
+        finally:
+            os.close(ready_fd)
+            ready_fd = None
 
     pid_file.write_text(str(os.getpid()), encoding="utf-8")
-    if transcript_file.exists():
-        transcript_file.unlink()
-    if error_file.exists():
-        error_file.unlink()
+    job_id, emission_lock = _claim_job(state_dir)
     _append_log(
         state_dir,
-        f"worker start model={args.model} device={args.device} compute_type={args.compute_type}",
+        f"worker start job={job_id} model={args.model} device={args.device} "
+        f"compute_type={args.compute_type}",
     )
 
+    channel: ControlChannel | None = None
+    linger = True
+    status = 0
+
+    def _release_slot() -> None:
+        # A stopper is already connected and waiting for this job, so the pid
+        # file and control socket can go to the next recording right away.
+        if channel is not None and channel.stop_requested.is_set():
+            channel.release()
+            _release_pid_file(pid_file)
+
     try:
-        text = _run_transcription_job(args, duration=None)
-        transcript_file.write_text(text, encoding="utf-8")
-        _append_log(state_dir, f"worker complete transcript_chars={len(text)}")
+        channel = ControlChannel(state_dir / CONTROL_SOCKET_NAME)
+        text = _run_transcription_job(
+            args,
+            duration=None,
+            stop_event=channel.stop_requested,
+            on_started=lambda: _report_ready("ok"),
+            on_captured=_release_slot,
+        )
+        result: dict[str, object] = {"text": text, "job": job_id}
+        _append_log(state_dir, f"worker complete job={job_id} transcript_chars={len(text)}")
     except Exception as exc:
         details = "".join(
             traceback.format_exception(type(exc), exc, exc.__traceback__)
         ).strip()
-        error_file.write_text(str(exc), encoding="utf-8")
-        _append_log(state_dir, f"worker error: {details}")
-        return 1
+        # Startup failures go back over the ready pipe; nobody will ask again.
+        linger = ready_fd is None
+        _report_ready(f"error: {exc}")
+        result = {"error": str(exc), "job": job_id}
+        _append_log(state_dir, f"worker error job={job_id}: {details}")
+        status = 1
+
+    try:
+        if channel is not None:
+            channel.publish(result)
+            # Stay reachable until a toggler collects the result (e.g. after
+            # --max-duration ended the recording on its own), and hold the
+            # emission lock until it has emitted: its stopper may first wait
+            # up to --stop-timeout for the previous job's text.
+            if linger and not channel.wait_delivered(2 * max(args.stop_timeout, 1.0)):
+                _append_log(state_dir, f"worker result for job {job_id} was not collected")
+            channel.close()
     finally:
-        if pid_file.exists():
-            pid_file.unlink()
+        _finish_job(state_dir, job_id, emission_lock)
+        _release_pid_file(pid_file)
 
-    return 0
+    return status
 
 
 def start_background(args: argparse.Namespace) -> int:
@@ -615,28 +3711,34 @@ def start_background(args: argparse.Namespace) -> int:
         print("Recording is already running.")
         return 0
 
+    reply = _capture_request(args, "start")
+    if reply is not None:
+        if "error" in reply:
+            print(str(reply["error"]))
+            return 0
+        _append_log(state_dir, "start requested (capture daemon)")
+        _notifier().send(
+            "Recording", "Started (press keybind again to stop)", timeout_ms=1200
+        )
+        print("Recording started.")
+        return 0
+
     cmd = [
         sys.executable,
         str(Path(__file__).resolve()),
         "--mode",
         "once",
         "--worker",
-        "--backend",
-        args.backend,
-        "--model",
-        args.model,
         "--samplerate",
         str(args.samplerate),
         "--channels",
         str(args.channels),
+        "--target-samplerate",
+        str(args.target_samplerate),
         "--notify-interval",
         str(args.notify_interval),
         "--state-dir",
         str(state_dir),
-        "--device",
-        args.device,
-        "--compute-type",
-        args.compute_type,
         "--beam-size",
         str(args.beam_size),
         "--task",
@@ -645,7 +3747,48 @@ def start_background(args: argparse.Namespace) -> int:
         args.whisperx_mode,
         "--whisperx-vad-method",
         args.whisperx_vad_method,
+        "--stream-chunk",
+        str(args.stream_chunk),
+        "--max-duration",
+        str(args.max_duration),
+        "--audio-transport",
+        args.audio_transport,
+        "--cache-size-mb",
+        str(args.cache_size_mb),
+        "--archive-format",
+        args.archive_format,
+        "--parallel-chunks",
+        str(args.parallel_chunks),
+        "--chunk-threshold",
+        str(args.chunk_threshold),
+        "--chunk-seconds",
+        str(args.chunk_seconds),
+        "--chunk-overlap",
+        str(args.chunk_overlap),
+        "--vad",
+        args.vad,
+        "--vad-padding",
+        str(args.vad_padding),
+        "--type-method",
+        args.type_method,
+        "--paste-threshold",
+        str(args.paste_threshold),
+        "--paste-keys",
+        args.paste_keys,
     ]
+    if args.type_delay is not None:
+        cmd.extend(["--type-delay", str(args.type_delay)])
+    if args.stream:
+        cmd.append("--stream")
+    if args.archive:
+        cmd.append("--archive")
+    if args.draft_model:
+        cmd.extend(["--draft-model", args.draft_model])
+    # Options the profile filled in are resolved by the worker, which also
+    # checks that the calibrated backend is still installed.
+    for key in PROFILE_DEFAULTS:
+        if key not in args.profile_filled and getattr(args, key) is not None:
+            cmd.extend([f"--{key.replace('_', '-')}", str(getattr(args, key))])
     if args.language:
         cmd.extend(["--language", args.language])
     if args.whisperx_hf_token:
@@ -655,6 +3798,11 @@ def start_background(args: argparse.Namespace) -> int:
     if args.whisperx_max_speakers is not None:
         cmd.extend(["--whisperx-max-speakers", str(args.whisperx_max_speakers)])
 
+    read_fd, write_fd = os.pipe()
+    cmd.extend(["--ready-fd", str(write_fd)])
+    launched_at = time.monotonic()
+    cmd.extend(["--launched-at", f"{launched_at:.6f}"])
+
     log_path = state_dir / "worker.log"
     with log_path.open("a", encoding="utf-8") as log_fh:
         subprocess.Popen(
@@ -662,18 +3810,32 @@ def start_background(args: argparse.Namespace) -> int:
             stdout=log_fh,
             stderr=log_fh,
             start_new_session=True,
+            pass_fds=(write_fd,),
         )
+    os.close(write_fd)
     _append_log(state_dir, "start requested")
-    # If worker fails immediately (common with model/device config issues),
-    # surface that early instead of only showing "No active recording" later.
-    time.sleep(0.15)
-    worker_error = _read_and_clear_error(state_dir / "error.txt")
-    if worker_error:
+
+    # The worker writes "ok" once the input stream is open, or the error that
+    # stopped it; EOF without a message means it died before reporting.
+    status = _wait_for_ready(read_fd, timeout=max(args.start_timeout, 1.0))
+    _log_stage(
+        "start_ready",
+        time.monotonic() - launched_at,
+        status="timeout" if status is None else ("ok" if status == "ok" else "error"),
+    )
+    if status is None:
+        _append_log(state_dir, "worker did not report readiness before start timeout")
+        print("Recording is still starting.")
+        return 0
+    if status != "ok":
+        worker_error = status.removeprefix("error: ") or (
+            f"Worker exited during startup. Check log: {log_path}"
+        )
         print(worker_error, file=sys.stderr)
-        Notifier().send("Transcription error", worker_error, timeout_ms=3000)
+        _notifier().send("Transcription error", worker_error, timeout_ms=3000)
         return 1
 
-    Notifier().send(
+    _notifier().send(
         "Recording", "Started (press keybind again to stop)", timeout_ms=1200
     )
     print("Recording started.")
@@ -681,53 +3843,82 @@ def start_background(args: argparse.Namespace) -> int:
 
 
 def stop_background(args: argparse.Namespace) -> int:
+    # The stop connection stays open until the text is emitted; closing it
+    # releases this job's emission lock, which the next job's stopper waits
+    # on, so results come out in job order.
+    with contextlib.ExitStack() as hold:
+        return _stop_and_emit(args, hold)
+
+
+def _stop_and_emit(args: argparse.Namespace, hold: contextlib.ExitStack) -> int:
     state_dir = Path(args.state_dir)
     pid_file = state_dir / "recording.pid"
-    transcript_file = state_dir / "transcript.txt"
-    error_file = state_dir / "error.txt"
-    pid = _read_pid(pid_file)
 
-    if not _is_alive(pid):
-        worker_error = _read_and_clear_error(error_file)
-        if worker_error:
-            print(worker_error, file=sys.stderr)
-            Notifier().send("Transcription error", worker_error, timeout_ms=3000)
-            return 1
-        if pid_file.exists():
-            pid_file.unlink()
-        print(f"No active recording. Check log: {state_dir / 'worker.log'}")
+    _notifier().send("Recording", "Stopping...", timeout_ms=1200)
+    try:
+        with _timed_stage("stop_roundtrip"):
+            result = _capture_request(args, "stop", hold=hold)
+            if result is None or result.get("idle"):
+                result = _request_stop(
+                    state_dir / CONTROL_SOCKET_NAME,
+                    timeout=max(args.stop_timeout, 1.0),
+                    hold=hold,
+                )
+    except TimeoutError:
+        print("Timed out waiting for transcription to finish.", file=sys.stderr)
+        _append_log(state_dir, "stop timeout waiting for worker result")
         return 1
 
-    assert pid is not None
-    os.kill(pid, signal.SIGINT)
-    Notifier().send("Recording", "Stopping...", timeout_ms=1200)
-
-    deadline = time.monotonic() + max(args.stop_timeout, 1.0)
-    while _is_alive(pid) and time.monotonic() < deadline:
-        time.sleep(0.1)
-
-    if _is_alive(pid):
-        print("Timed out waiting for transcription to finish.", file=sys.stderr)
-        _append_log(state_dir, "stop timeout waiting for worker exit")
+    if result is None:
+        if not _is_alive(_read_pid(pid_file)) and pid_file.exists():
+            pid_file.unlink()
+        print(f"No active recording. Check log: {state_dir / 'worker.log'}")
         return 1
+    if "job" in result:
+        job_id = int(result["job"])
+        _append_log(state_dir, f"stop collected job={job_id}")
+        # The worker or daemon replies as soon as it has the text; ordering
+        # behind the previous job happens here, on its own timeout.
+        with _timed_stage("order_wait", job=job_id):
+            if not _wait_for_job(state_dir, job_id - 1, max(args.stop_timeout, 1.0)):
+                _append_log(state_dir, f"job {job_id} stopped waiting for job {job_id - 1}")
 
-    worker_error = _read_and_clear_error(error_file)
-    if worker_error:
+    if "error" in result:
+        worker_error = str(result["error"])
         print(worker_error, file=sys.stderr)
-        Notifier().send("Transcription error", worker_error, timeout_ms=3000)
+        _notifier().send("Transcription error", worker_error, timeout_ms=3000)
         return 1
 
-    text = ""
-    if transcript_file.exists():
-        text = transcript_file.read_text(encoding="utf-8").strip()
-        transcript_file.unlink()
-
+    text = str(result.get("text", "")).strip()
     if not text:
         print("(No speech detected)")
-        Notifier().send("Done", "No speech detected", timeout_ms=1500)
+        _notifier().send("Done", "No speech detected", timeout_ms=1500)
         return 0
 
-    return _emit_text(text, args, Notifier())
+    return _emit_text(text, args, _notifier())
+
+
+def run_status(args: argparse.Namespace) -> int:
+    """Report recorder/server state for status bars; exit 0 only while recording."""
+    state_dir = Path(args.state_dir)
+    pid = _read_pid(state_dir / "recording.pid")
+    try:
+        server = _server_request(state_dir, {"op": "ping"}, timeout=1.0)
+    except (OSError, RuntimeError, ValueError):
+        server = None
+
+    recording = _is_alive(pid) or bool(server and server.get("recording"))
+    if _is_alive(pid):
+        print(f"recording (worker pid {pid})")
+    elif recording:
+        print("recording (capture daemon)")
+    else:
+        print("idle")
+    if server is not None:
+        config = server.get("config") or {}
+        mode = "capture daemon" if server.get("capture") else "server"
+        print(f"{mode}: {config.get('backend')} {config.get('model')}")
+    return 0 if recording else 1
 
 
 def parse_args() -> argparse.Namespace:
@@ -736,28 +3927,57 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--mode",
-        choices=("once", "start", "stop", "toggle"),
+        choices=(
+            "once",
+            "start",
+            "stop",
+            "toggle",
+            "status",
+            "serve",
+            "benchmark",
+            "stats",
+            "retranscribe",
+            "calibrate",
+        ),
         default="once",
-        help="once: record/transcribe immediately, start/stop: background toggle pieces, toggle: start if idle else stop",
+        help="once: record/transcribe immediately, start/stop: background toggle pieces, toggle: start if idle else stop, status: print whether a recording is running (exit 0 while recording), serve: keep the model loaded and answer requests on a Unix socket in --state-dir, benchmark: compare backend configurations on --benchmark-dir, stats: summarize per-stage timings from worker.log, retranscribe: decode every --archive recording again with the selected backend/model, calibrate: probe installed backends and hardware, time a reference clip and save the fastest configuration to --state-dir/profile.json as the default",
     )
     parser.add_argument("--start", action="store_true", help=argparse.SUPPRESS)
     parser.add_argument("--stop", action="store_true", help=argparse.SUPPRESS)
     parser.add_argument("--toggle", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Shortcut for --mode stats: print p50/p95 latency per stage from worker.log",
+    )
+    parser.add_argument(
+        "--stats-since",
+        type=float,
+        default=0.0,
+        help="Only aggregate stage timings from the last N hours in --mode stats (default: 0, whole log)",
+    )
     parser.add_argument(
         "--worker",
         action="store_true",
         help=argparse.SUPPRESS,
     )
+    parser.add_argument("--ready-fd", type=int, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--launched-at", type=float, default=None, help=argparse.SUPPRESS)
     parser.add_argument(
         "--backend",
         choices=("whispercpp", "ctranslate2", "whisperx"),
-        default="whispercpp",
-        help="Transcription backend (default: whispercpp)",
+        default=None,
+        help="Transcription backend (default: the --mode calibrate profile, else whispercpp)",
     )
     parser.add_argument(
         "--model",
-        default=DEFAULT_MODEL,
-        help="Model name or path. For whispercpp: ggml .bin path/name. For ctranslate2/whisperx: model name or model directory.",
+        default=None,
+        help="Model name or path. For whispercpp: ggml .bin path/name. For ctranslate2/whisperx: model name or model directory (default: the calibrated profile, else small).",
+    )
+    parser.add_argument(
+        "--draft-model",
+        default=None,
+        help="Speculative mode: emit this (small/fast) model's transcript immediately, then re-transcribe with --model in the background and copy the refined text to the clipboard",
     )
     parser.add_argument(
         "--task",
@@ -776,6 +3996,12 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_DURATION,
         help="Recording length in seconds for --mode once (default: 8). Use 0 for manual stop.",
     )
+    parser.add_argument(
+        "--max-duration",
+        type=float,
+        default=3600.0,
+        help="Hard cap in seconds on captured audio kept in memory; recording stops when reached (default: 3600, 0 for unlimited).",
+    )
     parser.add_argument(
         "--samplerate",
         type=int,
@@ -785,6 +4011,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--channels", type=int, default=1, help="Input channels (default: 1)"
     )
+    parser.add_argument(
+        "--target-samplerate",
+        type=int,
+        default=WHISPER_SAMPLERATE,
+        help="Downmix to mono and resample captured audio to this rate before transcription, so the device can record at its native format; 0 keeps the capture format (default: 16000)",
+    )
     parser.add_argument(
         "--notify-interval",
         type=float,
@@ -797,15 +4029,144 @@ def parse_args() -> argparse.Namespace:
         default="print",
         help="How to emit transcript text: print to terminal or type into active window",
     )
+    parser.add_argument(
+        "--capture",
+        action="store_true",
+        help="With --mode serve: keep the microphone stream open and record on start/stop requests, "
+        "so recordings begin instantly and include --preroll seconds from before the keypress.",
+    )
+    parser.add_argument(
+        "--preroll",
+        type=float,
+        default=0.5,
+        help="Seconds of audio before the start request kept by --capture (default: 0.5).",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Transcribe completed segments while still recording so stopping only decodes the tail.",
+    )
+    parser.add_argument(
+        "--stream-chunk",
+        type=float,
+        default=15.0,
+        help="Seconds of audio per streamed segment; cuts land on the quietest point near the end (default: 15).",
+    )
+    parser.add_argument(
+        "--vad",
+        choices=("off", "energy", "silero"),
+        default="off",
+        help="Trim leading/trailing silence before transcription and skip captures without speech. "
+        "silero needs torch (installed with whisperx) and falls back to energy (default: off).",
+    )
+    parser.add_argument(
+        "--vad-padding",
+        type=float,
+        default=0.3,
+        help="Seconds of audio kept around detected speech when --vad is enabled (default: 0.3).",
+    )
+    parser.add_argument(
+        "--parallel-chunks",
+        type=int,
+        default=0,
+        help="Decode recordings longer than --chunk-threshold as silence-split chunks in this many "
+        "parallel whispercpp/ctranslate2 processes, sharing the CPU threads between them (default: 0, off).",
+    )
+    parser.add_argument(
+        "--chunk-threshold",
+        type=float,
+        default=120.0,
+        help="Minimum recording length in seconds for --parallel-chunks (default: 120).",
+    )
+    parser.add_argument(
+        "--chunk-seconds",
+        type=float,
+        default=60.0,
+        help="Target chunk length in seconds for --parallel-chunks (default: 60).",
+    )
+    parser.add_argument(
+        "--chunk-overlap",
+        type=float,
+        default=0.5,
+        help="Seconds of overlap added around each chunk; repeated words are removed when stitching (default: 0.5).",
+    )
+    parser.add_argument(
+        "--cache-size-mb",
+        type=float,
+        default=16.0,
+        help="Size bound for the transcript cache keyed by audio hash and decode parameters in --state-dir (default: 16, 0 disables).",
+    )
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help="Keep a compressed copy of every recording in --state-dir/archive, indexed in SQLite for --mode retranscribe",
+    )
+    parser.add_argument(
+        "--archive-format",
+        choices=("flac", "opus"),
+        default="flac",
+        help="Archive codec: flac is lossless, opus is much smaller (default: flac)",
+    )
+    parser.add_argument(
+        "--retranscribe-jobs",
+        type=int,
+        default=2,
+        help="Parallel backend processes for --mode retranscribe (default: 2)",
+    )
+    parser.add_argument(
+        "--audio-transport",
+        choices=("pipe", "file"),
+        default="pipe",
+        help="pipe: stream WAV to whisper-cli stdin and read the transcript from stdout; "
+        "file: always write a WAV file. Other backends use a RAM-backed temp dir (default: pipe).",
+    )
+    parser.add_argument(
+        "--type-method",
+        choices=("auto", "type", "paste"),
+        default="type",
+        help="How --output type delivers text: simulated keystrokes, a clipboard paste that restores the "
+        "previous clipboard (typed instead when it holds non-text content), or auto (paste from "
+        "--paste-threshold characters when a clipboard tool exists; set --paste-keys for terminals) "
+        "(default: type).",
+    )
+    parser.add_argument(
+        "--paste-threshold",
+        type=int,
+        default=200,
+        help="Transcript length in characters from which --type-method auto pastes (default: 200).",
+    )
+    parser.add_argument(
+        "--paste-keys",
+        default="ctrl+v",
+        help="Key combination used to paste, e.g. ctrl+shift+v for terminals (default: ctrl+v).",
+    )
+    parser.add_argument(
+        "--type-delay",
+        type=int,
+        default=None,
+        help="Milliseconds between simulated keystrokes, e.g. 1 to speed up ydotool's 12+20 ms per key "
+        "(default: the typing tool's own timing).",
+    )
     parser.add_argument(
         "--device",
-        default="auto",
-        help="Inference device for faster-whisper (auto, cpu, cuda)",
+        default=None,
+        help="Inference device for faster-whisper (auto, cpu, cuda; default: the calibrated profile, else auto)",
     )
     parser.add_argument(
         "--compute-type",
-        default="auto",
-        help="faster-whisper compute type (auto, default, float16, int8, int8_float16, ...)",
+        default=None,
+        help="faster-whisper compute type (auto, default, float16, int8, int8_float16, ...; default: the calibrated profile, else auto)",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=None,
+        help="CPU threads for the whispercpp/ctranslate2 CLI (default: the calibrated profile, else the backend's own default)",
+    )
+    parser.add_argument(
+        "--calibrate-clip",
+        default=None,
+        help="16-bit WAV of speech to time in --mode calibrate (default: the latest --archive recording)",
     )
     parser.add_argument(
         "--beam-size",
@@ -842,16 +4203,39 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional maximum speaker count for WhisperX diarization.",
     )
+    parser.add_argument(
+        "--benchmark-dir",
+        default=None,
+        help="Directory of 16-bit PCM .wav files for --mode benchmark; a same-named .txt is used as reference transcript for WER.",
+    )
+    parser.add_argument(
+        "--benchmark-configs",
+        nargs="*",
+        default=None,
+        help="Configurations to compare as backend:model[:compute_type[:device]] (default: the current --backend/--model).",
+    )
+    parser.add_argument(
+        "--benchmark-output",
+        default=None,
+        help="Write benchmark results to this .json or .csv file instead of stdout.",
+    )
     parser.add_argument(
         "--state-dir",
         default=str(DEFAULT_STATE_DIR),
         help="Directory to store toggle state files",
     )
+    parser.add_argument(
+        "--start-timeout",
+        type=float,
+        default=15.0,
+        help="Max seconds to wait for the background worker to open the microphone on start",
+    )
     parser.add_argument(
         "--stop-timeout",
         type=float,
         default=90.0,
-        help="Max seconds to wait for background transcription to finish on stop",
+        help="Max seconds to wait for background transcription to finish on stop, and again "
+        "for the previous recording's text to be typed first",
     )
     parser.add_argument(
         "--toggle-debounce",
@@ -866,33 +4250,63 @@ def parse_args() -> argparse.Namespace:
             (args.start, "start"),
             (args.stop, "stop"),
             (args.toggle, "toggle"),
+            (args.stats, "stats"),
         )
         if flag
     ]
     if len(legacy_modes) > 1:
-        parser.error("Use only one of --start, --stop, or --toggle.")
+        parser.error("Use only one of --start, --stop, --toggle, or --stats.")
     if legacy_modes:
         args.mode = legacy_modes[0]
     if args.task == "translate" and not args.language:
         parser.error("--task translate requires --language so the source language is explicit.")
+    if args.mode != "calibrate":
+        _apply_profile(
+            args, check_installed=args.mode in ("once", "serve", "benchmark", "retranscribe")
+        )
     return args
 
 
 def main() -> int:
     args = parse_args()
 
+    if args.mode == "stats":
+        return run_stats(args)
+
+    if args.mode not in ("benchmark", "retranscribe", "status", "calibrate"):
+        role = "worker" if args.worker else ("server" if args.mode == "serve" else args.mode)
+        _configure_stage_log(Path(args.state_dir), role)
+    if args.launched_at is not None:
+        # CLOCK_MONOTONIC is system-wide, so the parent's stamp is comparable.
+        _log_stage("interpreter_start", time.monotonic() - args.launched_at)
+
     if args.worker:
         return run_worker(args)
 
     if args.mode == "once":
         return run_once(args)
 
+    if args.mode == "serve":
+        return run_server(args)
+
+    if args.mode == "benchmark":
+        return run_benchmark(args)
+
+    if args.mode == "retranscribe":
+        return run_retranscribe(args)
+
+    if args.mode == "calibrate":
+        return run_calibrate(args)
+
     if args.mode == "start":
         return start_background(args)
 
     if args.mode == "stop":
         return stop_background(args)
 
+    if args.mode == "status":
+        return run_status(args)
+
     state_dir = Path(args.state_dir)
     state_dir.mkdir(parents=True, exist_ok=True)
     debounce_file = state_dir / "last-toggle.txt"
@@ -910,6 +4324,9 @@ def main() -> int:
             return 0
 
     debounce_file.write_text(f"{now:.6f}", encoding="utf-8")
+    daemon = _capture_request(args, "ping")
+    if daemon is not None and daemon.get("recording"):
+        return stop_background(args)
     pid = _read_pid(state_dir / "recording.pid")
     if _is_alive(pid):
         return stop_background(args)